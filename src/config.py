@@ -3,6 +3,7 @@
 """
 
 import os
+import math
 import logging
 from pathlib import Path
 from dotenv import load_dotenv
@@ -46,6 +47,106 @@ def setup_logging():
 # API 설정
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
 DEEPSEEK_API_URL = "https://api.deepseek.com/v1/chat/completions"
+LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", "8"))  # 최대 동시 API 요청 수
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "120"))  # API 요청당 응답 대기 시간 (초)
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))  # 429/5xx 발생 시 재시도 횟수
+LLM_RATE_LIMIT = float(os.getenv("LLM_RATE_LIMIT", "10"))  # API 초당 최대 요청 수 (0이면 제한 없음)
+LLM_RATE_BURST = float(os.getenv("LLM_RATE_BURST", "10"))  # API 최대 연속 요청 수
+
+# 수집 설정
+COLLECTOR_MAX_WORKERS = int(os.getenv("COLLECTOR_MAX_WORKERS", "4"))  # 동시 검색 워커 수
+CHEMRXIV_RATE_LIMIT = float(os.getenv("CHEMRXIV_RATE_LIMIT", "2"))  # 호스트별 초당 최대 요청 수
+CHEMRXIV_RATE_BURST = float(os.getenv("CHEMRXIV_RATE_BURST", "4"))  # 호스트별 최대 연속 요청 수
+ARXIV_RATE_LIMIT = float(os.getenv("ARXIV_RATE_LIMIT", "0.33"))  # arXiv API 초당 최대 요청 수 (3초당 1회)
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"  # data/http_cache 조건부 요청 캐시 사용
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "3600"))  # 검색 응답을 서버 확인 없이 재사용할 시간 (초)
+HTTP_CACHE_MAX_AGE_DAYS = float(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "30"))  # 이 기간 동안 갱신되지 않은 HTTP 캐시 항목 삭제 (일)
+HTTP_CACHE_MAX_MB = float(os.getenv("HTTP_CACHE_MAX_MB", "500"))  # HTTP 캐시 최대 크기 (MB), 넘으면 오래된 항목부터 삭제
+INCREMENTAL_COLLECTION = os.getenv("INCREMENTAL_COLLECTION", "true").lower() == "true"  # 검색어별 워터마크 이후 논문만 수집
+FULL_RESYNC = os.getenv("FULL_RESYNC", "false").lower() == "true"  # 워터마크를 무시하고 전체 기간 재수집
+NEAR_DUPLICATE_DETECTION = os.getenv("NEAR_DUPLICATE_DETECTION", "true").lower() == "true"  # 유사 논문(버전, 교차 게시)을 최신 버전 하나로 합침
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.8"))  # 제목+초록 추정 Jaccard 유사도 기준
+NEAR_DUPLICATE_RETENTION_DAYS = float(os.getenv("NEAR_DUPLICATE_RETENTION_DAYS", "90"))  # 게시일이 이 기간보다 오래된 서명 삭제 (일, 검색 기간 30일의 3배)
+DOWNLOAD_SUPPLEMENTARY = os.getenv("DOWNLOAD_SUPPLEMENTARY", "false").lower() == "true"  # 보충 자료 다운로드 여부
+SUPPLEMENTARY_MAX_MB = float(os.getenv("SUPPLEMENTARY_MAX_MB", "50"))  # 보충 자료 파일당 최대 크기 (MB)
+
+# 검색어 (따옴표 구문이 다른 구문을 포함하면 하나의 검색으로 통합됨)
+SEARCH_TERMS = [
+    # 핵심 검색어
+    '"CO2 reduction"',
+    '"CO2 electroreduction"',
+    '"CO2 electrocatalysis"',
+    
+    # 촉매 관련
+    '"CO2 reduction catalyst"',
+    '"CO2 electrocatalyst"',
+    '"CO2 reduction Cu"',
+    '"CO2 reduction Ag"',
+    '"CO2 reduction Au"',
+    
+    # 메커니즘 관련
+    '"CO2 reduction mechanism"',
+    '"CO2 reduction HER"',
+    '"CO2 reduction selectivity"',
+    
+    # 성능 관련
+    '"CO2 reduction efficiency"',
+    '"CO2 reduction current density"',
+    '"CO2 reduction stability"'
+]
+
+# 품질 점수 항목별 가중치 (services/scoring.py에 등록된 항목 이름 기준, 0이면 계산하지 않음)
+# 환경 변수 SCORING_WEIGHTS="relevance=0.6,content=0.1" 형식으로 일부 항목만 덮어쓸 수 있음
+DEFAULT_SCORING_WEIGHTS = {
+    'author': 0.3,          # 저자 수
+    'category': 0.3,        # 카테고리 수
+    'keyword': 0.3,         # 키워드 수
+    'abstract': 0.2,        # 초록 길이
+    'time': 0.2,            # 최신성
+    'relevance': 0.5,       # 검색어 주제 관련성 (검색어 대비 BM25 점수)
+    'title_quality': 0.0,   # 제목/초록 형식, 카테고리 다양성
+    'content': 0.0          # 방법론/실험 언급
+}
+
+def parse_scoring_weights(value: str, defaults: dict = DEFAULT_SCORING_WEIGHTS) -> dict:
+    """"이름=가중치,..." 문자열로 기본 가중치를 덮어쓴 딕셔너리를 반환합니다. 형식이 잘못된 항목은 경고 후 무시합니다."""
+    weights = dict(defaults)
+    logger = logging.getLogger('rank_papers')
+    for item in (value or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        name, separator, weight = item.partition('=')
+        name = name.strip()
+        try:
+            if not separator or not name:
+                raise ValueError("'이름=가중치' 형식이 아닙니다")
+            parsed = float(weight)
+            if not math.isfinite(parsed) or parsed < 0:
+                raise ValueError("가중치는 0 이상의 유한한 수여야 합니다")
+        except ValueError as e:
+            logger.warning(f"SCORING_WEIGHTS 항목 '{item}'을(를) 무시합니다: {e}")
+            continue
+        weights[name] = parsed
+    return weights
+
+SCORING_WEIGHTS = parse_scoring_weights(os.getenv("SCORING_WEIGHTS", ""))
+if os.getenv("RELEVANCE_WEIGHT"):
+    logging.getLogger('rank_papers').warning(
+        "RELEVANCE_WEIGHT는 더 이상 사용하지 않습니다. SCORING_WEIGHTS=relevance=<가중치>로 지정하세요."
+    )
+
+# 분석 파이프라인 설정
+RANK_BEFORE_ANALYZE = os.getenv("RANK_BEFORE_ANALYZE", "true").lower() == "true"  # 메타데이터 점수로 먼저 거른 뒤 LLM 분석
+ANALYZE_TOP_N = int(os.getenv("ANALYZE_TOP_N", "10"))  # LLM 분석 대상 상위 논문 수
+ANALYZE_MARGIN = int(os.getenv("ANALYZE_MARGIN", "5"))  # 순위 변동에 대비한 추가 분석 논문 수
+ANALYSIS_MEMORY_CACHE_ENTRIES = int(os.getenv("ANALYSIS_MEMORY_CACHE_ENTRIES", "2048"))  # 메모리 캐시 최대 항목 수
+ANALYSIS_MEMORY_CACHE_MB = int(os.getenv("ANALYSIS_MEMORY_CACHE_MB", "64"))  # 메모리 캐시 최대 크기 (MB)
+TRANSLATION_CACHE_DAYS = int(os.getenv("TRANSLATION_CACHE_DAYS", "180"))  # 번역 캐시 유지 기간 (일)
+COMBINED_ANALYSIS = os.getenv("COMBINED_ANALYSIS", "true").lower() == "true"  # 논문당 한 번의 API 호출로 번역/분류/요약
+# 통합 분석 모델. 개별 모드는 분류/요약에 deepseek-reasoner를 쓰지만, 통합 모드 기본값은 JSON 출력을 지원하는 deepseek-chat
+# deepseek-reasoner로 지정하면 JSON 출력 모드 없이 요청함 (분석 캐시 키에 포함됨)
+COMBINED_ANALYSIS_MODEL = os.getenv("COMBINED_ANALYSIS_MODEL", "deepseek-chat")
 
 # 분석 프롬프트
 ANALYSIS_PROMPTS = {
@@ -139,6 +240,29 @@ ANALYSIS_PROMPTS = {
 {abstract}
 
 번역문을 반환해주세요.
+""",
+    
+    "combined": """
+다음 논문을 분석하여 JSON 객체 하나로만 응답해주세요. JSON 외의 다른 텍스트는 포함하지 마세요.
+
+필드 설명:
+1. title_ko: 제목의 한국어 번역
+2. abstract_ko: 초록 전체의 한국어 번역
+   - 모든 전문 용어는 원문(영어)을 병기하고 <strong>태그로 강조 표시
+   - 의미 단위로 개행하고 '-입니다' 체계 유지
+3. classification: 가장 주요한 분야 하나
+4. tags: 5-8개의 키워드 배열
+   - 기술적 용어 2-3개, 실용적 용어 2-3개, 혁신적 용어 1-2개
+5. summary: 일반 독자도 이해하기 쉬운 요약
+   - [연구의 중요성과 배경], [주요 내용과 방법], [기대되는 효과와 기여점] 세 부분으로 구성
+   - 중요한 용어는 **용어**와 같이 굵게 표시하고 구체적인 수치나 예시를 포함
+   - 불필요한 마크다운 기호(#, -, * 등)는 사용하지 말 것
+
+제목: {title}
+초록: {abstract}
+
+응답 형식:
+{{"title_ko": "...", "abstract_ko": "...", "classification": "...", "tags": ["...", "..."], "summary": "..."}}
 """
 }
 
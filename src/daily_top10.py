@@ -1,5 +1,5 @@
 import datetime
-from typing import List, Dict
+from typing import List, Dict, Iterable
 import pandas as pd
 import pytz
 import time
@@ -13,6 +13,13 @@ from analysis_manager import AnalysisManager
 import json
 from services.email_sender import EmailSender
 from services.arxiv_collector import ChemRxivCollector
+from services.near_duplicates import NearDuplicateDetector
+from config import (
+    COLLECTOR_MAX_WORKERS, CHEMRXIV_RATE_LIMIT, CHEMRXIV_RATE_BURST, INCREMENTAL_COLLECTION, FULL_RESYNC,
+    HTTP_CACHE_ENABLED, SEARCH_CACHE_TTL, HTTP_CACHE_MAX_AGE_DAYS, HTTP_CACHE_MAX_MB, DOWNLOAD_SUPPLEMENTARY, SUPPLEMENTARY_MAX_MB,
+    RANK_BEFORE_ANALYZE, ANALYZE_TOP_N, ANALYZE_MARGIN, SEARCH_TERMS,
+    NEAR_DUPLICATE_DETECTION, NEAR_DUPLICATE_THRESHOLD, NEAR_DUPLICATE_RETENTION_DAYS, DATA_DIR
+)
 
 # 로깅 설정
 logging.basicConfig(
@@ -36,63 +43,50 @@ for module in ['paper_analyzer', 'arxiv_collector', 'rank_papers']:
 # Initialize analyzers and collector
 paper_analyzer = PaperAnalyzer()
 analysis_manager = AnalysisManager()
-paper_collector = ChemRxivCollector()
+paper_collector = ChemRxivCollector(
+    max_workers=COLLECTOR_MAX_WORKERS,
+    rate_limit=CHEMRXIV_RATE_LIMIT,
+    rate_burst=CHEMRXIV_RATE_BURST,
+    use_http_cache=HTTP_CACHE_ENABLED,
+    search_cache_ttl=SEARCH_CACHE_TTL,
+    show_progress=False,  # 스케줄러(데몬) 실행이므로 진행률 표시 없음
+    download_supplementary=DOWNLOAD_SUPPLEMENTARY,
+    supplementary_max_mb=SUPPLEMENTARY_MAX_MB
+)
+near_duplicate_detector = NearDuplicateDetector(
+    DATA_DIR / 'cache' / 'near_duplicates.db',
+    threshold=NEAR_DUPLICATE_THRESHOLD
+) if NEAR_DUPLICATE_DETECTION else None
 
-def get_papers() -> List[Dict]:
+def get_papers(max_workers: int = COLLECTOR_MAX_WORKERS, incremental: bool = INCREMENTAL_COLLECTION,
+               force_full: bool = FULL_RESYNC) -> List[Dict]:
     try:
         logger.info("CO2RR 관련 논문을 가져오는 중...")
         
-        # 검색어 리스트
-        search_terms = [
-            # 핵심 검색어
-            '"CO2 reduction"',
-            '"CO2 electroreduction"',
-            '"CO2 electrocatalysis"',
-            
-            # 촉매 관련
-            '"CO2 reduction catalyst"',
-            '"CO2 electrocatalyst"',
-            '"CO2 reduction Cu"',
-            '"CO2 reduction Ag"',
-            '"CO2 reduction Au"',
-            
-            # 메커니즘 관련
-            '"CO2 reduction mechanism"',
-            '"CO2 reduction HER"',
-            '"CO2 reduction selectivity"',
-            
-            # 성능 관련
-            '"CO2 reduction efficiency"',
-            '"CO2 reduction current density"',
-            '"CO2 reduction stability"'
-        ]
-        
-        all_papers = []
-        seen_ids = set()  # 중복 논문 제거용
-        
-        for term in search_terms:
-            logger.info(f"검색어 '{term}'로 논문 검색 중...")
-            
-            # 검색 옵션 설정
-            search_options = {
-                "term": term,
-                "skip": 0,
-                "limit": 50,
-                "sort": "PUBLISHED_DATE_DESC",
-                "searchDateFrom": (datetime.datetime.now(pytz.UTC) - datetime.timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                "searchDateTo": datetime.datetime.now(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
-            }
-            
-            # 논문 수집
-            papers = paper_collector.collect(search_options)
-            
-            if papers:
-                # 중복 제거
-                for paper in papers:
-                    paper_id = paper.get('id')
-                    if paper_id and paper_id not in seen_ids:
-                        seen_ids.add(paper_id)
-                        all_papers.append(paper)
+        # 검색 옵션 설정
+        search_date_from = (datetime.datetime.now(pytz.UTC) - datetime.timedelta(days=30)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        search_date_to = datetime.datetime.now(pytz.UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        search_options = {
+            "skip": 0,
+            "limit": 50,
+            "sort": "PUBLISHED_DATE_DESC",
+            "searchDateFrom": search_date_from,
+            "searchDateTo": search_date_to
+        }
+        
+        # 논문 동시 수집 (포함 관계인 검색어는 하나의 검색으로 통합, ID 기준 중복 제거)
+        # 증분 모드에서는 검색어별 워터마크 이후 논문만 수집
+        all_papers = paper_collector.collect_terms(
+            SEARCH_TERMS,
+            search_options,
+            max_workers=max_workers,
+            incremental=incremental,
+            force_full=force_full
+        )
+        
+        # 버전/교차 게시 등 거의 같은 논문은 최신 버전 하나만 남김
+        if near_duplicate_detector is not None:
+            all_papers = near_duplicate_detector.collapse(all_papers)
             
         if not all_papers:
             logger.warning("수집된 논문이 없습니다.")
@@ -111,12 +105,23 @@ def get_papers() -> List[Dict]:
         logger.error(f"논문 수집 중 오류 발생: {e}")
         return []
 
-def save_top10(papers: List[Dict], analyzer: PaperQualityAnalyzer):
+def select_top_candidates(papers: List[Dict], analyzer: PaperQualityAnalyzer,
+                          top_n: int = ANALYZE_TOP_N, margin: int = ANALYZE_MARGIN) -> List[Dict]:
+    """메타데이터 품질 점수로 먼저 순위를 매겨 LLM 분석 대상(top_n + margin)만 선택합니다."""
+    limit = top_n + max(margin, 0)
+    if len(papers) <= limit:
+        return papers
+    
+    # 점수가 같으면 수집 순서를 유지 (안정 정렬)
+    candidates = [paper for _, paper in analyzer.top_k(papers, limit)]
+    logger.info(f"{len(papers)}개 논문 중 상위 {len(candidates)}개만 분석합니다. (top {top_n} + 여유 {margin})")
+    return candidates
+
+def save_top10(papers: Iterable[Dict], analyzer: PaperQualityAnalyzer):
     try:
-        # 논문 품질 점수 계산 및 정렬
-        paper_scores = []
-        for paper in papers:
-            score = analyzer.analyze_paper(paper)
+        # 논문 품질 점수 계산 후 상위 10개만 선택 (크기 10의 힙, 동점이면 수집 순서 유지)
+        top10 = []
+        for rank, (score, paper) in enumerate(analyzer.top_k(papers, 10), 1):
             # categories가 딕셔너리 리스트인 경우 처리
             categories = paper['categories']
             if isinstance(categories, list) and categories and isinstance(categories[0], dict):
@@ -141,8 +146,8 @@ def save_top10(papers: List[Dict], analyzer: PaperQualityAnalyzer):
             else:
                 author_count = len(authors.split(',')) if isinstance(authors, str) else 0
                 
-            paper_scores.append({
-                'rank': 0,
+            top10.append({
+                'rank': rank,
                 'title': paper['title'].replace('\n', ' '),
                 'url': paper['html_url'],
                 'score': score,
@@ -153,16 +158,6 @@ def save_top10(papers: List[Dict], analyzer: PaperQualityAnalyzer):
                 'abstract': paper['abstract'].replace('\n', ' ')
             })
         
-        # 점수로 정렬
-        paper_scores.sort(key=lambda x: x['score'], reverse=True)
-        
-        # 상위 10개만 선택
-        top10 = paper_scores[:10]
-        
-        # 순위 추가
-        for i, paper in enumerate(top10, 1):
-            paper['rank'] = i
-        
         # DataFrame 생성
         df = pd.DataFrame(top10)
         
@@ -199,20 +194,40 @@ def main():
         logger.info(f"작업 시작 시간: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
         try:
+            # 오래되었거나 용량을 넘는 HTTP 캐시 정리
+            if paper_collector.http_cache is not None:
+                paper_collector.http_cache.prune(
+                    max_age=HTTP_CACHE_MAX_AGE_DAYS * 86400,
+                    max_bytes=int(HTTP_CACHE_MAX_MB * 1024 * 1024)
+                )
+            
+            # 검색 기간보다 충분히 오래된 유사 논문 서명 정리
+            if near_duplicate_detector is not None:
+                near_duplicate_detector.prune(max_age=NEAR_DUPLICATE_RETENTION_DAYS * 86400)
+            
             # 논문 수집
             papers = get_papers()
             if papers:
+                analyzer = PaperQualityAnalyzer()
+                analyzer.index_papers(papers)  # 전체 후보로 관련성 색인 구성
+                
+                # 메타데이터 점수로 LLM 분석 대상 선별
+                if RANK_BEFORE_ANALYZE:
+                    papers = select_top_candidates(papers, analyzer)
+                
                 # 논문 분석
                 analyzed_papers = paper_analyzer.analyze_papers(papers)
                 
                 # Top 10 저장
-                analyzer = PaperQualityAnalyzer()
                 save_top10(analyzed_papers, analyzer)
                 
                 # 이메일 전송
                 email_sender = EmailSender()
                 email_sender.send_report(analyzed_papers)
                 
+                # 처리가 끝난 뒤에만 워터마크 갱신 (실패 시 다음 실행에서 다시 수집)
+                paper_collector.commit_watermarks()
+                
                 logger.info("작업이 성공적으로 완료되었습니다.")
             else:
                 logger.warning("수집된 논문이 없어 작업을 건너뜁니다.")
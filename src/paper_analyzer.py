@@ -1,12 +1,20 @@
 import json
-import requests
+import hashlib
+import threading
+import unicodedata
 from typing import Dict, Any, List
 import time
 import logging
 import os
-from pathlib import Path
-from config import DEEPSEEK_API_KEY, DEEPSEEK_API_URL, ANALYSIS_PROMPTS, DATA_DIR
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from config import (
+    DEEPSEEK_API_KEY, DEEPSEEK_API_URL, ANALYSIS_PROMPTS, DATA_DIR, COMBINED_ANALYSIS, COMBINED_ANALYSIS_MODEL,
+    LLM_MAX_IN_FLIGHT, LLM_TIMEOUT, LLM_MAX_RETRIES, LLM_RATE_LIMIT, LLM_RATE_BURST,
+    ANALYSIS_MEMORY_CACHE_ENTRIES, ANALYSIS_MEMORY_CACHE_MB, TRANSLATION_CACHE_DAYS
+)
+from services.llm_client import DeepSeekClient
+from services.rate_limiter import get_rate_limiter
+from services.analysis_cache import get_shared_cache
 
 # 로깅 설정
 logger = logging.getLogger('paper_analyzer')
@@ -19,115 +27,182 @@ handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)
 logger.addHandler(handler)
 logger.setLevel(logging.INFO)
 
+# 모델 및 생성 설정 (분석 캐시 키에 포함됨)
+CHAT_MODEL = "deepseek-chat"
+REASONER_MODEL = "deepseek-reasoner"
+TEMPERATURE = 0.7
+
+SYSTEM_PROMPT = """You are a helpful AI assistant that analyzes academic papers.
+When analyzing papers:
+1. For classification, provide one main field and 5-8 tags
+2. For summary, structure the content clearly with sections
+3. For translation, maintain academic tone while being clear
+Always format your response according to the specified format in the prompt."""
+
+TRANSLATION_PROMPT = """다음은 논문 초록을 한국어로 번역하는 요구사항입니다:
+
+1. 번역 대상: 다음 영문 초록을 한국어로 번역해주세요.
+2. 번역 규칙:
+   - 모든 전문 용어는 원문(영어)을 병기하고 <strong>태그로 강조 표시합니다. (예: 분리 배치 정규화(<strong>Separated Batch Normalization, SeBN</strong>))
+   - 의미 단위로 개행해 가독성을 높입니다.
+   - '-입니다' 체계를 유지하며 자연스러운 전문성을 확보합니다.
+   - 핵심물질, 실험방법, 성능 지표 등은 <strong>태그로 굵게 표시해 시각적 강조를 적용합니다.
+
+영문 초록:
+{abstract}
+
+한국어 번역:"""
+
+# DeepSeek API 초당 요청 수 제한 (프로세스 전체 공유, 분석기 인스턴스마다 다시 설정하지 않음)
+if LLM_RATE_LIMIT:
+    get_rate_limiter().configure(DEEPSEEK_API_URL, LLM_RATE_LIMIT, LLM_RATE_BURST)
+
+# 같은 원문을 여러 스레드가 동시에 번역하지 않도록 키별 잠금 사용
+_translation_locks: Dict[str, threading.Lock] = {}
+_translation_locks_guard = threading.Lock()
+
 class PaperAnalyzer:
-    def __init__(self, cache_expiry_days: int = 7):
+    def __init__(self, cache_expiry_days: int = 7, combined_analysis: bool = COMBINED_ANALYSIS,
+                 max_in_flight: int = LLM_MAX_IN_FLIGHT, combined_model: str = COMBINED_ANALYSIS_MODEL):
         if not DEEPSEEK_API_KEY:
             raise ValueError("DEEPSEEK_API_KEY 환경 변수가 설정되지 않았습니다.")
             
-        self.headers = {
-            "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
-            "Content-Type": "application/json"
-        }
+        # API 클라이언트 (연결 풀 + 적응형 동시성 제어)
+        self.max_in_flight = max(1, max_in_flight)
+        self.client = DeepSeekClient(
+            DEEPSEEK_API_KEY,
+            DEEPSEEK_API_URL,
+            max_in_flight=self.max_in_flight,
+            timeout=(10, LLM_TIMEOUT),
+            max_retries=LLM_MAX_RETRIES
+        )
         
         # 캐시 설정
         self.cache_dir = DATA_DIR / 'cache'
         self.cache_expiry_days = cache_expiry_days
         self._init_cache()
         
-        # 메모리 캐시 초기화
-        self.cache = {}
-        logger.info("메모리 캐시가 초기화되었습니다.")
+        # 통합 분석 모드 (논문당 API 호출 1회)
+        self.combined_analysis = combined_analysis
+        self.combined_model = combined_model
+        self._prompt_fingerprint = self._build_prompt_fingerprint()
+        self._translation_fingerprints = self._build_translation_fingerprints()
     
     def _init_cache(self):
-        """캐시 디렉토리를 초기화합니다."""
+        """캐시 디렉토리와 2단계(메모리 LRU + SQLite) 캐시를 초기화합니다."""
         try:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"캐시 디렉토리가 생성되었습니다: {self.cache_dir}")
+            # 프로세스 내 모든 PaperAnalyzer 인스턴스가 같은 캐시를 공유
+            self.cache_store = get_shared_cache(
+                self.cache_dir / 'analysis_cache.db',
+                default_ttl_seconds=self.cache_expiry_days * 24 * 3600,
+                max_entries=ANALYSIS_MEMORY_CACHE_ENTRIES,
+                max_bytes=ANALYSIS_MEMORY_CACHE_MB * 1024 * 1024
+            )
+            logger.info(f"캐시 저장소가 초기화되었습니다: {self.cache_store.db_path}")
         except Exception as e:
-            logger.error(f"캐시 디렉토리 생성 중 오류 발생: {e}")
+            logger.error(f"캐시 초기화 중 오류 발생: {e}")
             raise
     
-    def _get_cache_path(self, paper_id: str) -> Path:
-        """캐시 파일 경로를 반환합니다."""
-        return self.cache_dir / f"{paper_id}.json"
-    
-    def _is_cache_valid(self, cache_path: Path) -> bool:
-        """캐시가 유효한지 확인합니다."""
-        if not cache_path.exists():
-            return False
-            
-        cache_time = datetime.fromtimestamp(cache_path.stat().st_mtime)
-        expiry_time = datetime.now() - timedelta(days=self.cache_expiry_days)
+    def _build_prompt_fingerprint(self) -> str:
+        """분석 결과에 영향을 주는 프롬프트, 모델, temperature 설정의 해시를 반환합니다."""
+        prompt_names = ["classification", "summary"]
+        if self.combined_analysis:
+            prompt_names.append("combined")
         
-        return cache_time > expiry_time
+        settings = {
+            "mode": "combined" if self.combined_analysis else "sequential",
+            "system_prompt": SYSTEM_PROMPT,
+            "translation_prompt": TRANSLATION_PROMPT,
+            "prompts": {name: ANALYSIS_PROMPTS[name] for name in prompt_names},
+            "models": [CHAT_MODEL, REASONER_MODEL] + ([self.combined_model] if self.combined_analysis else []),
+            "temperature": TEMPERATURE
+        }
+        return self._settings_hash(settings)
     
-    def _load_from_cache(self, paper_id: str) -> Dict[str, Any]:
+    def _build_translation_fingerprints(self) -> Dict[str, str]:
+        """번역을 만드는 프롬프트별({"translation", "combined"}) 프롬프트, 모델, temperature 설정의 해시를 반환합니다."""
+        base = {"system_prompt": SYSTEM_PROMPT, "model": CHAT_MODEL, "temperature": TEMPERATURE}
+        return {
+            "translation": self._settings_hash({**base, "prompt": TRANSLATION_PROMPT}),
+            "combined": self._settings_hash({**base, "model": self.combined_model, "prompt": ANALYSIS_PROMPTS["combined"]})
+        }
+    
+    @staticmethod
+    def _settings_hash(settings: Dict[str, Any]) -> str:
+        encoded = json.dumps(settings, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _cache_key(self, title: str, abstract: str) -> str:
+        """논문 입력(제목, 초록)과 프롬프트 설정으로 내용 기반 캐시 키를 생성합니다."""
+        hasher = hashlib.sha256(self._prompt_fingerprint.encode('ascii'))
+        for text in (title, abstract):
+            hasher.update(b'\0')
+            hasher.update((text or '').strip().encode('utf-8'))
+        return hasher.hexdigest()
+    
+    def _load_from_cache(self, cache_key: str) -> Dict[str, Any]:
         """캐시에서 데이터를 로드합니다."""
-        cache_path = self._get_cache_path(paper_id)
+        try:
+            data = self.cache_store.get(cache_key)
+        except Exception as e:
+            logger.error(f"캐시 로드 중 오류 발생: {e}")
+            return None
         
-        if not self._is_cache_valid(cache_path):
-            logger.debug(f"캐시가 만료되었거나 존재하지 않습니다: {paper_id}")
+        if data is None:
+            logger.debug(f"캐시가 만료되었거나 존재하지 않습니다: {cache_key}")
             return None
-            
+        
+        logger.info(f"캐시에서 데이터를 로드했습니다: {cache_key}")
+        return data
+    
+    def _load_many_from_cache(self, cache_keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 논문의 캐시를 한 번의 쿼리로 로드합니다."""
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.info(f"캐시에서 데이터를 로드했습니다: {paper_id}")
-                return data
+            return self.cache_store.get_many(cache_keys)
         except Exception as e:
             logger.error(f"캐시 로드 중 오류 발생: {e}")
-            return None
+            return {}
     
-    def _save_to_cache(self, paper_id: str, data: Dict[str, Any]):
+    def _save_to_cache(self, cache_key: str, data: Dict[str, Any], ttl_days: float = None):
         """데이터를 캐시에 저장합니다."""
-        cache_path = self._get_cache_path(paper_id)
-        
+        ttl_days = ttl_days if ttl_days is not None else self.cache_expiry_days
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            logger.info(f"데이터를 캐시에 저장했습니다: {paper_id}")
+            self.cache_store.set(cache_key, data, ttl_seconds=ttl_days * 24 * 3600)
+            logger.info(f"데이터를 캐시에 저장했습니다: {cache_key}")
         except Exception as e:
             logger.error(f"캐시 저장 중 오류 발생: {e}")
     
     def _cleanup_cache(self):
-        """만료된 캐시 파일을 정리합니다."""
+        """만료된 캐시 항목을 정리합니다."""
         try:
-            for cache_file in self.cache_dir.glob('*.json'):
-                if not self._is_cache_valid(cache_file):
-                    cache_file.unlink()
-                    logger.info(f"만료된 캐시 파일을 삭제했습니다: {cache_file}")
+            deleted = self.cache_store.evict_expired()
+            if deleted:
+                logger.info(f"만료된 캐시 항목 {deleted}개를 삭제했습니다.")
         except Exception as e:
             logger.error(f"캐시 정리 중 오류 발생: {e}")
     
-    def _call_api(self, prompt: str, model: str = "deepseek-chat") -> str:
+    def _call_api(self, prompt: str, model: str = CHAT_MODEL,
+                  response_format: Dict[str, str] = None, max_tokens: int = 2000) -> str:
         """DeepSeek API를 호출하여 응답을 받아옵니다."""
         try:
-            response = requests.post(
-                DEEPSEEK_API_URL,
-                headers={
-                    "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "model": model,
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": """You are a helpful AI assistant that analyzes academic papers.
-When analyzing papers:
-1. For classification, provide one main field and 5-8 tags
-2. For summary, structure the content clearly with sections
-3. For translation, maintain academic tone while being clear
-Always format your response according to the specified format in the prompt."""
-                        },
-                        {"role": "user", "content": prompt}
-                    ],
-                    "temperature": 0.7,
-                    "max_tokens": 2000
-                }
-            )
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"].strip()
+            payload = {
+                "model": model,
+                "messages": [
+                    {
+                        "role": "system",
+                        "content": SYSTEM_PROMPT
+                    },
+                    {"role": "user", "content": prompt}
+                ],
+                "temperature": TEMPERATURE,
+                "max_tokens": max_tokens
+            }
+            if response_format:
+                payload["response_format"] = response_format
+            
+            data = self.client.chat(payload)
+            return data["choices"][0]["message"]["content"].strip()
         except Exception as e:
             print(f"API 호출 중 오류 발생: {str(e)}")
             raise
@@ -159,6 +234,13 @@ Always format your response according to the specified format in the prompt."""
                 # 빈 태그 제거
                 tags = [tag for tag in tags if tag]
         
+        return {
+            "classification": classification,
+            "tags": self._normalize_tags(classification, tags)
+        }
+    
+    def _normalize_tags(self, classification: str, tags: List[str]) -> List[str]:
+        """태그를 보완하고 불필요한 태그를 제거합니다."""
         # 태그가 없거나 3개 미만이면 기본 태그 생성
         if not tags or len(tags) < 3:
             if '컴퓨터 비전' in classification:
@@ -171,10 +253,7 @@ Always format your response according to the specified format in the prompt."""
         # 백엔드 관련 태그 제거
         tags = [tag for tag in tags if not any(x in tag.lower() for x in ['backend', 'api', 'server', 'database'])]
         
-        return {
-            "classification": classification,
-            "tags": tags
-        }
+        return tags
     
     def _clean_response(self, text: str) -> str:
         """응답을 HTML 형식으로 변환하고 정리합니다."""
@@ -224,25 +303,50 @@ Always format your response according to the specified format in the prompt."""
         
         return result
     
+    def _translation_key(self, text: str, target_lang: str = "ko", source: str = "translation") -> str:
+        """정규화된 원문의 해시, 대상 언어, 번역 출처(source) 프롬프트 설정으로 번역 캐시 키를 생성합니다."""
+        normalized = ' '.join(unicodedata.normalize('NFKC', text or '').split())
+        digest = hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+        return f"translation:{target_lang}:{self._translation_fingerprints[source][:16]}:{digest}"
+    
+    def _remember_translation(self, text: str, translated: str, target_lang: str = "ko", source: str = "translation"):
+        """번역 결과를 번역 캐시에 저장합니다."""
+        if text and translated:
+            self._save_to_cache(self._translation_key(text, target_lang, source), {"text": translated}, ttl_days=TRANSLATION_CACHE_DAYS)
+    
     def _translate_abstract(self, abstract: str) -> str:
-        """초록을 한국어로 번역합니다."""
+        """초록을 한국어로 번역합니다. 같은 원문은 번역 캐시에서 재사용합니다.
+
+        통합 분석 모드에서는 현재 통합 프롬프트로 만든 번역도 재사용합니다.
+        """
+        memo_key = self._translation_key(abstract)
+        lookup_keys = [memo_key]
+        if self.combined_analysis:
+            lookup_keys.append(self._translation_key(abstract, source="combined"))
+        with _translation_locks_guard:
+            lock = _translation_locks.setdefault(memo_key, threading.Lock())
+        
+        try:
+            with lock:
+                for key in lookup_keys:
+                    cached = self._load_from_cache(key)
+                    if cached and cached.get("text"):
+                        return cached["text"]
+                
+                response = self._request_translation(abstract)
+                self._remember_translation(abstract, response)
+                return response
+        finally:
+            with _translation_locks_guard:
+                _translation_locks.pop(memo_key, None)
+    
+    def _request_translation(self, abstract: str) -> str:
+        """API를 호출하여 텍스트를 한국어로 번역합니다."""
         print("한국어 번역 중...")
         
-        prompt = f"""다음은 논문 초록을 한국어로 번역하는 요구사항입니다:
-
-1. 번역 대상: 다음 영문 초록을 한국어로 번역해주세요.
-2. 번역 규칙:
-   - 모든 전문 용어는 원문(영어)을 병기하고 <strong>태그로 강조 표시합니다. (예: 분리 배치 정규화(<strong>Separated Batch Normalization, SeBN</strong>))
-   - 의미 단위로 개행해 가독성을 높입니다.
-   - '-입니다' 체계를 유지하며 자연스러운 전문성을 확보합니다.
-   - 핵심물질, 실험방법, 성능 지표 등은 <strong>태그로 굵게 표시해 시각적 강조를 적용합니다.
-
-영문 초록:
-{abstract}
-
-한국어 번역:"""
+        prompt = TRANSLATION_PROMPT.format(abstract=abstract)
         
-        response = self._call_api(prompt, model="deepseek-chat")
+        response = self._call_api(prompt, model=CHAT_MODEL)
         
         # 번역 규칙 부분 제거
         if "번역 규칙" in response:
@@ -259,27 +363,35 @@ Always format your response according to the specified format in the prompt."""
         print("번역 완료")
         return response
 
-    def _analyze_paper_content(self, title: str, abstract: str) -> Dict[str, Any]:
-        """논문 내용을 분석합니다."""
-        # 분류 및 태그 생성
+    def _classify_paper(self, title: str, abstract: str) -> Dict[str, Any]:
+        """논문의 분류와 태그를 생성합니다."""
         classification_response = self._call_api(
             ANALYSIS_PROMPTS["classification"].format(
                 title=title,
                 abstract=abstract
             ),
-            model="deepseek-reasoner"
+            model=REASONER_MODEL
         )
-        classification_result = self._parse_classification(classification_response)
-        
-        # 요약 생성
+        return self._parse_classification(classification_response)
+    
+    def _summarize_paper(self, title: str, abstract: str) -> str:
+        """논문 요약을 생성합니다."""
         summary_response = self._call_api(
             ANALYSIS_PROMPTS["summary"].format(
                 title=title,
                 abstract=abstract
             ),
-            model="deepseek-reasoner"
+            model=REASONER_MODEL
         )
-        summary = self._clean_response(summary_response)
+        return self._clean_response(summary_response)
+
+    def _analyze_paper_content(self, title: str, abstract: str) -> Dict[str, Any]:
+        """논문 내용을 분석합니다."""
+        # 분류 및 태그 생성
+        classification_result = self._classify_paper(title, abstract)
+        
+        # 요약 생성
+        summary = self._summarize_paper(title, abstract)
         
         return {
             "classification": classification_result["classification"],
@@ -287,6 +399,117 @@ Always format your response according to the specified format in the prompt."""
             "summary": summary
         }
     
+    def _parse_combined_response(self, response: str) -> Dict[str, Any]:
+        """통합 분석 JSON 응답을 파싱합니다. 형식이 올바른 필드만 반환합니다."""
+        text = response.strip()
+        start, end = text.find('{'), text.rfind('}')
+        if start == -1 or end <= start:
+            return {}
+        
+        try:
+            data = json.loads(text[start:end + 1])
+        except json.JSONDecodeError as e:
+            logger.warning(f"통합 분석 응답 JSON 파싱 실패: {e}")
+            return {}
+        
+        if not isinstance(data, dict):
+            return {}
+        
+        parsed = {}
+        for key in ("title_ko", "abstract_ko", "classification", "summary"):
+            value = data.get(key)
+            if isinstance(value, str) and value.strip():
+                parsed[key] = value.strip()
+        
+        tags = data.get("tags")
+        if isinstance(tags, str):
+            tags = tags.split(',')
+        if isinstance(tags, list):
+            tags = [str(tag).strip().strip('[]').strip() for tag in tags if isinstance(tag, str)]
+            tags = [tag for tag in tags if tag]
+            if tags:
+                parsed["tags"] = tags
+        
+        return parsed
+    
+    def _analyze_paper_combined(self, title: str, abstract: str) -> Dict[str, Any]:
+        """한 번의 API 호출(combined_model)로 번역, 분류, 태그, 요약을 생성합니다. 누락된 필드만 개별 프롬프트로 보완합니다."""
+        try:
+            response = self._call_api(
+                ANALYSIS_PROMPTS["combined"].format(
+                    title=title,
+                    abstract=abstract
+                ),
+                model=self.combined_model,
+                # deepseek-reasoner는 JSON 출력 모드를 지원하지 않음 (응답에서 JSON 부분만 파싱)
+                response_format=None if self.combined_model == REASONER_MODEL else {"type": "json_object"},
+                max_tokens=4000
+            )
+            parsed = self._parse_combined_response(response)
+        except Exception as e:
+            logger.error(f"통합 분석 중 오류 발생: {e}")
+            parsed = {}
+        
+        missing = [key for key in ("title_ko", "abstract_ko", "classification", "tags", "summary") if key not in parsed]
+        if missing:
+            logger.warning(f"통합 분석 응답에서 누락된 필드를 개별 요청으로 보완합니다: {missing}")
+        
+        # 번역 결과를 번역 캐시에 공유
+        self._remember_translation(title, parsed.get("title_ko"), source="combined")
+        self._remember_translation(abstract, parsed.get("abstract_ko"), source="combined")
+        
+        # 필드별 대체 처리
+        title_ko = parsed.get("title_ko") or self._translate_abstract(title)
+        abstract_ko = parsed.get("abstract_ko") or self._translate_abstract(abstract)
+        
+        if "classification" in parsed and "tags" in parsed:
+            classification = parsed["classification"].strip('[]').strip()
+            tags = self._normalize_tags(classification, parsed["tags"])
+        else:
+            classification_result = self._classify_paper(title, abstract)
+            classification = classification_result["classification"]
+            tags = classification_result["tags"]
+        
+        if "summary" in parsed:
+            summary = self._clean_response(parsed["summary"])
+        else:
+            summary = self._summarize_paper(title, abstract)
+        
+        return {
+            "title_ko": title_ko,
+            "abstract_ko": abstract_ko,
+            "analysis": {
+                "classification": classification,
+                "tags": list(dict.fromkeys(tags)),
+                "summary": summary
+            }
+        }
+    
+    def _analyze_texts(self, title: str, abstract: str) -> Dict[str, Any]:
+        """설정된 모드에 따라 번역과 내용 분석을 수행합니다."""
+        if self.combined_analysis:
+            logger.info("통합 분석 중...")
+            result = self._analyze_paper_combined(title, abstract)
+            logger.info("분석 완료")
+            return result
+        
+        # 한국어 번역
+        logger.info("한국어 번역 중...")
+        title_ko = self._translate_abstract(title)
+        abstract_ko = self._translate_abstract(abstract)
+        logger.info("번역 완료")
+        
+        # 논문 내용 분석
+        logger.info("논문 내용 분석 중...")
+        analysis = self._analyze_paper_content(title, abstract)
+        logger.info("분석 완료")
+        
+        return {
+            "title_ko": title_ko,
+            "abstract_ko": abstract_ko,
+            "analysis": analysis
+        }
+    
     def analyze_paper(self, paper: Dict) -> Dict:
         """단일 논문 분석"""
         try:
@@ -295,14 +518,6 @@ Always format your response according to the specified format in the prompt."""
             if not paper_id:
                 raise ValueError("논문 ID가 없습니다.")
             
-            # 캐시 확인
-            cached_result = self._load_from_cache(paper_id)
-            if cached_result:
-                logger.info(f"캐시에서 논문 분석 결과를 로드했습니다: {paper['title']}")
-                return cached_result
-            
-            logger.info(f"\n논문 분석 시작: {paper['title']}")
-            
             # URL 처리
             html_url = paper.get("html_url", "")
             if not html_url and "url" in paper:
@@ -321,19 +536,22 @@ Always format your response according to the specified format in the prompt."""
                 "html_text": paper.get("html_text", "")
             }
             
-            # 한국어 번역
-            logger.info("한국어 번역 중...")
-            result["title_ko"] = self._translate_abstract(result["title"])
-            result["abstract_ko"] = self._translate_abstract(result["abstract"])
-            logger.info("번역 완료")
+            # 캐시 확인 (제목/초록/프롬프트가 같으면 재사용)
+            cache_key = self._cache_key(result["title"], result["abstract"])
+            cached_result = self._load_from_cache(cache_key)
+            if cached_result:
+                logger.info(f"캐시에서 논문 분석 결과를 로드했습니다: {paper['title']}")
+                result.update(cached_result)
+                return result
             
-            # 논문 내용 분석
-            logger.info("논문 내용 분석 중...")
-            result["analysis"] = self._analyze_paper_content(result["title"], result["abstract"])
-            logger.info("분석 완료")
+            logger.info(f"\n논문 분석 시작: {paper['title']}")
+            
+            # 번역 및 논문 내용 분석
+            texts = self._analyze_texts(result["title"], result["abstract"])
+            result.update(texts)
             
             # 캐시에 저장
-            self._save_to_cache(paper_id, result)
+            self._save_to_cache(cache_key, texts)
             
             return result
             
@@ -341,53 +559,70 @@ Always format your response according to the specified format in the prompt."""
             logger.error(f"논문 분석 중 오류 발생: {e}")
             raise
     
+    def _analyze_and_cache(self, cache_key: str, paper: Dict) -> Dict[str, Any]:
+        """analyze_papers의 단일 논문 분석. 결과를 캐시에 저장하고, 오류 시 None을 반환합니다."""
+        try:
+            logger.info(f"\n논문 분석 시작: {paper['title']}")
+            
+            # 번역 및 논문 내용 분석
+            texts = self._analyze_texts(paper['title'], paper['abstract'])
+            
+            # 캐시에 저장
+            self._save_to_cache(cache_key, texts)
+            return texts
+            
+        except Exception as e:
+            logger.error(f"논문 분석 중 오류 발생 ({paper.get('title', 'N/A')}): {e}")
+            return None
+    
     def analyze_papers(self, papers: List[Dict]) -> List[Dict]:
-        """여러 논문을 분석합니다."""
+        """여러 논문을 동시에 분석합니다. 결과는 입력 순서를 유지합니다."""
         try:
-            analyzed_papers = []
-            for paper in papers:
-                # 논문 ID 추출
-                paper_id = paper.get("id", "")
-                if not paper_id:
+            if not papers:
+                return []
+            
+            # 만료된 캐시 정리 후 전체 논문의 캐시를 한 번에 조회
+            self._cleanup_cache()
+            cache_keys = [self._cache_key(paper.get('title', ''), paper.get('abstract', '')) for paper in papers]
+            results = self._load_many_from_cache(cache_keys)
+            logger.info(f"캐시 적중: {sum(1 for key in cache_keys if key in results)}/{len(papers)}")
+            
+            # 캐시에 없는 입력만 분석 (내용이 같은 논문은 한 번만 분석)
+            pending = {}
+            for paper, cache_key in zip(papers, cache_keys):
+                if not paper.get("id", ""):
                     logger.warning(f"논문 ID가 없습니다: {paper['title']}")
                     continue
-                
-                # 캐시 확인
-                cached_result = self._load_from_cache(paper_id)
-                if cached_result:
-                    logger.info(f"캐시에서 논문 분석 결과를 로드했습니다: {paper['title']}")
-                    analyzed_papers.append(cached_result)
+                if cache_key not in results:
+                    pending.setdefault(cache_key, paper)
+            
+            if pending:
+                workers = min(self.max_in_flight, len(pending))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results.update(zip(pending, executor.map(self._analyze_and_cache, pending, pending.values())))
+            
+            analyzed_papers = []
+            for paper, cache_key in zip(papers, cache_keys):
+                if not paper.get("id", ""):
                     continue
                 
-                # 논문 분석
-                logger.info(f"\n논문 분석 시작: {paper['title']}")
-                
-                # 한국어 번역
-                logger.info("한국어 번역 중...")
-                translated_title = self._translate_abstract(paper['title'])
-                translated_abstract = self._translate_abstract(paper['abstract'])
-                logger.info("번역 완료")
-                
-                # 논문 내용 분석
-                logger.info("논문 내용 분석 중...")
-                analysis_result = self._analyze_paper_content(paper['title'], paper['abstract'])
-                logger.info("분석 완료")
+                texts = results.get(cache_key)
+                if not texts:
+                    # 분석 실패 시 원본 논문 유지
+                    analyzed_papers.append(paper)
+                    continue
                 
-                # 결과 저장
-                analyzed_paper = {
+                # 메타데이터는 항상 최신 수집 결과 사용
+                analyzed_papers.append({
                     **paper,
-                    'translated_title': translated_title,
-                    'translated_abstract': translated_abstract,
-                    'analysis': analysis_result
-                }
-                
-                # 캐시에 저장
-                self._save_to_cache(paper_id, analyzed_paper)
-                
-                analyzed_papers.append(analyzed_paper)
+                    'translated_title': texts['title_ko'],
+                    'translated_abstract': texts['abstract_ko'],
+                    'analysis': texts['analysis']
+                })
             
+            logger.info(f"메모리 캐시 통계: {self.cache_store.stats()}")
             return analyzed_papers
             
         except Exception as e:
             logger.error(f"논문 분석 중 오류 발생: {e}")
-            return papers 
\ No newline at end of file
+            return papers
@@ -1,27 +1,47 @@
 import arxiv
 import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+import numpy as np
 import pandas as pd
 import pytz
-import time
 import os
 import logging
 from paper_analyzer import PaperAnalyzer
-from config import DATA_DIR
+from config import DATA_DIR, ARXIV_RATE_LIMIT, SEARCH_TERMS, SCORING_WEIGHTS
+from services.rate_limiter import get_rate_limiter
+from services.relevance_index import BM25Index
+from services.scoring import COMPONENTS, build_feature_table, to_record, top_k
 
 # 로깅 설정
 logger = logging.getLogger('rank_papers')
 
 class PaperQualityAnalyzer:
-    def __init__(self):
+    """등록된 점수 항목(services/scoring.py)의 가중합으로 논문 품질 점수를 계산합니다.
+
+    가중치가 0이 아닌 항목이 필요로 하는 특성만 논문당 한 번 추출해 특성 테이블을 만들고,
+    각 항목은 이 테이블의 열만 읽어 점수를 계산합니다.
+    """
+
+    def __init__(self, search_terms: List[str] = SEARCH_TERMS, weights: Dict[str, float] = None):
         self.logger = logging.getLogger(__name__)
         self.paper_analyzer = PaperAnalyzer()
-        self.quality_indicators = {
-            'author_metrics': 0.3,    # 저자 관련 지표
-            'paper_metrics': 0.3,     # 논문 특성 지표
-            'time_metrics': 0.2,      # 시간 관련 지표
-            'content_metrics': 0.2    # 내용 관련 지표
-        }
+        self.weights = dict(SCORING_WEIGHTS if weights is None else weights)
+        
+        unknown = sorted(set(self.weights) - set(COMPONENTS))
+        if unknown:
+            logger.warning(f"등록되지 않은 점수 항목은 무시합니다: {unknown}")
+        self.components = [COMPONENTS[name] for name, weight in self.weights.items() if weight and name in COMPONENTS]
+        self.features = [feature for component in self.components for feature in component.features]
+        
+        # 검색어 대비 주제 관련성 (제목/초록/키워드 BM25 역색인)
+        self.relevance_index = BM25Index()
+        self.query_terms = list(dict.fromkeys(
+            tuple(tokens) for tokens in (BM25Index.tokenize(term) for term in search_terms) if tokens
+        ))
+    
+    def index_papers(self, papers: Iterable[Dict[str, Any]]):
+        """논문을 관련성 색인에 추가합니다. 순위 계산 전에 전체 후보를 넣어 두면 점수가 일관됩니다."""
+        self.relevance_index.add_many(to_record(paper) for paper in papers)
     
     def analyze_paper(self, paper: Dict[str, Any]) -> float:
         """논문의 품질을 분석하고 점수를 반환합니다."""
@@ -29,161 +49,73 @@ class PaperQualityAnalyzer:
             if not paper:
                 logger.error("논문 데이터가 없습니다.")
                 return 0.0
-                
-            score = 0.0
-            
-            # 1. 저자 수 점수 (최대 2점)
-            author_score = self._calculate_author_score(paper)
-            score += author_score * self.quality_indicators['author_metrics']
             
-            # 2. 카테고리 관련성 점수 (최대 2점)
-            category_score = self._calculate_category_score(paper)
-            score += category_score * self.quality_indicators['paper_metrics']
-            
-            # 3. 키워드 관련성 점수 (최대 2점)
-            keyword_score = self._calculate_keyword_score(paper)
-            score += keyword_score * self.quality_indicators['paper_metrics']
-            
-            # 4. 초록 길이 점수 (최대 2점)
-            abstract_score = self._calculate_abstract_score(paper)
-            score += abstract_score * self.quality_indicators['content_metrics']
-            
-            # 5. 시간 관련 점수 (최대 2점)
-            time_score = self._calculate_time_score(paper)
-            score += time_score * self.quality_indicators['time_metrics']
-            
-            logger.info(f"논문 '{paper.get('title', 'N/A')}'의 품질 점수: {score:.2f}")
+            scores, _ = self.score_batch([paper])
+            score = float(scores[0])
+            logger.info(f"논문 '{to_record(paper).get('title', 'N/A')}'의 품질 점수: {score:.2f}")
             return score
             
         except Exception as e:
             logger.error(f"논문 품질 분석 중 오류 발생: {e}")
             return 0.0
     
-    def _calculate_author_score(self, paper: Dict[str, Any]) -> float:
-        """저자 관련 점수를 계산합니다."""
-        try:
-            authors = paper.get('authors', [])
-            if isinstance(authors, list):
-                author_count = len(authors)
-            else:
-                author_count = len(authors.split(',')) if isinstance(authors, str) else 0
-            return min(author_count * 0.2, 2.0)
-        except Exception as e:
-            logger.error(f"저자 점수 계산 중 오류 발생: {e}")
-            return 0.0
-    
-    def _calculate_category_score(self, paper: Dict[str, Any]) -> float:
-        """카테고리 관련 점수를 계산합니다."""
-        try:
-            categories = paper.get('categories', [])
-            if isinstance(categories, list):
-                category_count = len(categories)
-            else:
-                category_count = len(categories.split(',')) if isinstance(categories, str) else 0
-            return min(category_count * 0.4, 2.0)
-        except Exception as e:
-            logger.error(f"카테고리 점수 계산 중 오류 발생: {e}")
-            return 0.0
-    
-    def _calculate_keyword_score(self, paper: Dict[str, Any]) -> float:
-        """키워드 관련 점수를 계산합니다."""
-        try:
-            keywords = paper.get('keywords', [])
-            if isinstance(keywords, list):
-                keyword_count = len(keywords)
-            else:
-                keyword_count = len(keywords.split(',')) if isinstance(keywords, str) else 0
-            return min(keyword_count * 0.2, 2.0)
-        except Exception as e:
-            logger.error(f"키워드 점수 계산 중 오류 발생: {e}")
-            return 0.0
-    
-    def _calculate_abstract_score(self, paper: Dict[str, Any]) -> float:
-        """초록 관련 점수를 계산합니다."""
-        try:
-            abstract = paper.get('abstract', '')
-            word_count = len(abstract.split())
-            return min(word_count * 0.01, 2.0)
-        except Exception as e:
-            logger.error(f"초록 점수 계산 중 오류 발생: {e}")
-            return 0.0
-    
-    def _calculate_time_score(self, paper: Dict[str, Any]) -> float:
-        """시간 관련 점수를 계산합니다."""
-        try:
-            submission_date = paper.get('submission_date')
-            if not submission_date:
-                return 0.0
-                
-            if isinstance(submission_date, str):
-                try:
-                    # ISO 형식인 경우
-                    submission_date = datetime.fromisoformat(submission_date)
-                except ValueError:
-                    try:
-                        # 다른 형식인 경우
-                        submission_date = datetime.strptime(submission_date, '%Y-%m-%d')
-                    except ValueError:
-                        return 0.0
-                
-            days_since_submission = (datetime.now() - submission_date).days
-            return max(2.0 - (days_since_submission * 0.01), 0.0)
-        except Exception as e:
-            logger.error(f"시간 점수 계산 중 오류 발생: {e}")
-            return 0.0
-    
-    def _calculate_paper_score(self, paper) -> float:
-        score = 0
-        # 제목 품질 평가
-        title_words = paper.title.split()
-        title_length = len(title_words)
-        if 5 <= title_length <= 10:
-            score += 0.8
-        elif 11 <= title_length <= 15:
-            score += 0.6
-        else:
-            score += 0.4
-            
-        # 제목의 명확성 (특수문자, 대문자 사용 등)
-        if any(word[0].isupper() for word in title_words):
-            score += 0.2
-            
-        # 초록 품질 평가
-        abstract_words = paper.summary.split()
-        abstract_length = len(abstract_words)
-        if abstract_length >= 200:
-            score += 0.8
-        elif abstract_length >= 100:
-            score += 0.6
-        else:
-            score += 0.4
-            
-        # 카테고리 다양성
-        category_count = len(paper.categories)
-        if category_count >= 3:
-            score += 0.5
-        elif category_count == 2:
-            score += 0.3
-        else:
-            score += 0.1
-            
-        return score
-    
-    def _calculate_content_score(self, paper) -> float:
-        score = 0
-        abstract = paper.summary.lower()
-        
-        # 방법론 언급 평가
-        method_keywords = ['method', 'approach', 'algorithm', 'technique', 'framework', 'model', 'architecture']
-        method_count = sum(1 for keyword in method_keywords if keyword in abstract)
-        score += min(method_count * 0.2, 0.6)  # 최대 0.6점
+    def score_batch(self, papers: List[Dict[str, Any]]) -> Tuple[np.ndarray, pd.DataFrame]:
+        """여러 논문의 품질 점수를 한 번에 계산합니다.
+
+        (점수 배열, 항목별 점수 DataFrame)을 입력 순서대로 반환합니다.
+        항목별 점수 열 이름은 '<항목 이름>_score'입니다.
+        """
+        columns = [f"{component.name}_score" for component in self.components]
+        if not papers:
+            return np.zeros(0), pd.DataFrame(columns=columns)
         
-        # 실험/평가 언급 평가
-        eval_keywords = ['experiment', 'evaluation', 'result', 'performance', 'benchmark', 'comparison']
-        eval_count = sum(1 for keyword in eval_keywords if keyword in abstract)
-        score += min(eval_count * 0.2, 0.4)  # 최대 0.4점
+        # 특성 테이블 구성 (논문당 한 번만 추출)
+        records = [to_record(paper) for paper in papers]
+        features = build_feature_table(records, self.features, {
+            'relevance_index': self.relevance_index,
+            'query_terms': self.query_terms
+        })
         
-        return score
+        # 항목별 점수
+        components = pd.DataFrame(
+            {f"{component.name}_score": component.compute(features) for component in self.components},
+            index=features.index, columns=columns
+        )
+        weights = np.array([self.weights[component.name] for component in self.components], dtype=float)
+        scores = components.to_numpy(dtype=float) @ weights
+        logger.debug(f"논문 {len(papers)}개의 품질 점수를 계산했습니다.")
+        return scores, components
+    
+    def top_k(self, papers: Iterable[Dict[str, Any]], k: int, chunk_size: int = 1000) -> List[Tuple[float, Dict[str, Any]]]:
+        """논문을 chunk_size개씩 읽어 점수를 매기고, 상위 k개를 (점수, 논문) 목록으로 반환합니다.
+
+        크기 k의 최소 힙만 유지하므로 입력 전체를 목록으로 만들거나 정렬하지 않습니다.
+        점수가 같으면 먼저 들어온 논문이 앞에 옵니다.
+        """
+        count = 0
+
+        def score_chunk(chunk: List[Dict[str, Any]]) -> List[float]:
+            nonlocal count
+            count += len(chunk)
+            scores, _ = self.score_batch(chunk)
+            return scores.tolist()
+
+        selected = top_k(papers, k, score_chunk, chunk_size)
+        logger.info(f"논문 {count}개 중 상위 {len(selected)}개를 선택했습니다.")
+        return selected
+
+class RateLimitedArxivClient(arxiv.Client):
+    """페이지 요청마다 공유 속도 제한기에서 토큰을 얻는 arXiv 클라이언트입니다."""
+
+    def __init__(self, rate_limit: float = ARXIV_RATE_LIMIT, **kwargs):
+        kwargs.setdefault('delay_seconds', 0)  # 고정 대기 대신 토큰 버킷 사용
+        super().__init__(**kwargs)
+        self.rate_limit = rate_limit
+        self.rate_limiter = get_rate_limiter()
+
+    def _parse_feed(self, url: str, first_page: bool = True, _try_index: int = 0):
+        self.rate_limiter.acquire(url, self.rate_limit)
+        return super()._parse_feed(url, first_page=first_page, _try_index=_try_index)
 
 def get_recent_papers(days: int = 7) -> List[Dict]:
     # 7일 전 날짜 계산 (UTC 기준)
@@ -191,7 +123,7 @@ def get_recent_papers(days: int = 7) -> List[Dict]:
     start_date = end_date - datetime.timedelta(days=days)
     
     # arXiv 검색 쿼리 생성
-    client = arxiv.Client()
+    client = RateLimitedArxivClient()
     search = arxiv.Search(
         query='cat:cs.AI',
         max_results=100,  # 한 번에 가져올 최대 결과 수 제한
@@ -206,7 +138,6 @@ def get_recent_papers(days: int = 7) -> List[Dict]:
             if paper.published < start_date:
                 break
             papers.append(paper)
-            time.sleep(0.1)  # API 요청 간 간격 추가
     except Exception as e:
         print(f"논문 수집 중 오류 발생: {e}")
         if not papers:  # 논문을 하나도 수집하지 못한 경우
@@ -0,0 +1,252 @@
+import copy
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+# 로깅 설정
+logger = logging.getLogger('paper_analyzer')
+
+class AnalysisCacheStore:
+    """논문 분석 결과를 저장하는 SQLite(WAL) 기반 캐시입니다.
+
+    항목마다 만료 시각(expires_at)을 저장하며, 인덱스를 통해 만료 항목을
+    한 번의 쿼리로 조회/삭제합니다. 여러 스레드에서 공유할 수 있습니다.
+    """
+
+    # SQLite 바인딩 변수 개수 제한 대비
+    _BATCH_SIZE = 500
+
+    def __init__(self, db_path: Path, default_ttl_seconds: float = 7 * 24 * 3600):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl_seconds = default_ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._init_schema()
+
+    def _init_schema(self):
+        """테이블과 인덱스를 생성합니다."""
+        with self._lock:
+            # auto_vacuum은 테이블 생성 전에 설정해야 적용됨
+            self._conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    key TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_cache_expires_at ON analysis_cache (expires_at)"
+            )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """유효한 캐시 항목을 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 키를 한 번에 조회하여 {키: 데이터} 형태로 반환합니다."""
+        return {key: data for key, (data, _, _) in self.get_many_entries(keys).items()}
+
+    def get_many_entries(self, keys: Iterable[str]) -> Dict[str, Tuple[Dict[str, Any], float, int]]:
+        """여러 키를 한 번에 조회하여 {키: (데이터, 만료 시각, 저장 크기)} 형태로 반환합니다."""
+        keys = list(dict.fromkeys(key for key in keys if key))
+        results = {}
+        now = time.time()
+        for i in range(0, len(keys), self._BATCH_SIZE):
+            batch = keys[i:i + self._BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT key, data, expires_at FROM analysis_cache WHERE key IN ({placeholders}) AND expires_at > ?",
+                    (*batch, now)
+                ).fetchall()
+            for key, data, expires_at in rows:
+                try:
+                    results[key] = (json.loads(data), expires_at, len(data))
+                except json.JSONDecodeError as e:
+                    logger.error(f"캐시 데이터 디코딩 중 오류 발생 ({key}): {e}")
+        return results
+
+    def set(self, key: str, data: Dict[str, Any], ttl_seconds: float = None):
+        """캐시 항목을 저장합니다. 같은 키가 있으면 덮어씁니다."""
+        self.set_many({key: data}, ttl_seconds)
+
+    def set_many(self, items: Dict[str, Dict[str, Any]], ttl_seconds: float = None):
+        """여러 캐시 항목을 하나의 트랜잭션으로 저장합니다."""
+        if not items:
+            return
+        now = time.time()
+        expires_at = now + (ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds)
+        rows = [
+            (key, json.dumps(data, ensure_ascii=False, default=str), now, expires_at)
+            for key, data in items.items()
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO analysis_cache (key, data, created_at, expires_at) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+
+    def delete(self, key: str):
+        """캐시 항목을 삭제합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+
+    def evict_expired(self, vacuum: bool = True) -> int:
+        """만료된 항목을 삭제하고 삭제된 개수를 반환합니다. vacuum이면 빈 페이지를 반환합니다."""
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM analysis_cache WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            if vacuum and deleted:
+                self._conn.execute("PRAGMA incremental_vacuum")
+        return deleted
+
+    def vacuum(self):
+        """데이터베이스 파일 전체를 재구성하여 크기를 줄입니다."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+class LRUCache:
+    """항목 수와 바이트 크기로 제한되는 스레드 안전 LRU 캐시입니다."""
+
+    def __init__(self, max_entries: int = 2048, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """값을 반환하고 최근 사용으로 표시합니다. 없거나 만료되었으면 None을 반환합니다."""
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None and entry[1] <= time.time():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: str, value: Any, expires_at: float, size: int):
+        """값을 저장하고 한도를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            self._items[key] = (value, expires_at, size)
+            self.total_bytes += size
+            while len(self._items) > self.max_entries or self.total_bytes > self.max_bytes:
+                oldest = next(iter(self._items))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _remove(self, key: str):
+        _, _, size = self._items.pop(key)
+        self.total_bytes -= size
+
+    def stats(self) -> Dict[str, int]:
+        """적중/미스 횟수와 현재 크기를 반환합니다."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._items),
+                "bytes": self.total_bytes
+            }
+
+
+class TieredAnalysisCache:
+    """프로세스 메모리 LRU와 SQLite 저장소를 결합한 2단계 캐시입니다.
+
+    메모리에서 먼저 찾고, 없는 키만 모아 한 번의 쿼리로 저장소에서 읽은 뒤
+    메모리에 올려 둡니다. 같은 실행 안에서 같은 항목을 디스크에서 두 번 읽지 않습니다.
+    메모리 항목은 복사본으로 주고받으므로 호출한 쪽에서 결과를 수정해도 캐시는 바뀌지 않습니다.
+    """
+
+    def __init__(self, store: AnalysisCacheStore, memory: LRUCache):
+        self.store = store
+        self.memory = memory
+
+    @property
+    def db_path(self) -> Path:
+        return self.store.db_path
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목을 반환합니다. 없으면 None을 반환합니다."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 키를 조회합니다. 메모리에 없는 키만 저장소에서 일괄 조회합니다."""
+        results = {}
+        missing = []
+        for key in dict.fromkeys(key for key in keys if key):
+            value = self.memory.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                results[key] = copy.deepcopy(value)
+
+        if missing:
+            for key, (data, expires_at, size) in self.store.get_many_entries(missing).items():
+                self.memory.put(key, copy.deepcopy(data), expires_at, size)
+                results[key] = data
+        return results
+
+    def set(self, key: str, data: Dict[str, Any], ttl_seconds: float = None):
+        """메모리와 저장소에 함께 저장합니다."""
+        self.store.set(key, data, ttl_seconds)
+        ttl = ttl_seconds if ttl_seconds is not None else self.store.default_ttl_seconds
+        size = len(json.dumps(data, ensure_ascii=False, default=str))
+        self.memory.put(key, copy.deepcopy(data), time.time() + ttl, size)
+
+    def evict_expired(self, vacuum: bool = True) -> int:
+        """저장소의 만료 항목을 정리합니다. 메모리 항목은 조회 시 만료를 확인합니다."""
+        return self.store.evict_expired(vacuum)
+
+    def stats(self) -> Dict[str, int]:
+        """메모리 캐시 통계를 반환합니다."""
+        return self.memory.stats()
+
+
+_shared_caches: Dict[str, TieredAnalysisCache] = {}
+_shared_caches_lock = threading.Lock()
+
+def get_shared_cache(db_path: Path, default_ttl_seconds: float = 7 * 24 * 3600,
+                     max_entries: int = 2048, max_bytes: int = 64 * 1024 * 1024) -> TieredAnalysisCache:
+    """DB 경로별로 프로세스 전체에서 공유되는 2단계 캐시를 반환합니다."""
+    key = str(Path(db_path).resolve())
+    with _shared_caches_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            cache = TieredAnalysisCache(
+                AnalysisCacheStore(db_path, default_ttl_seconds),
+                LRUCache(max_entries=max_entries, max_bytes=max_bytes)
+            )
+            _shared_caches[key] = cache
+        return cache
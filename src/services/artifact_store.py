@@ -0,0 +1,181 @@
+import os
+import gzip
+import time
+import shutil
+import sqlite3
+import hashlib
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, BinaryIO, Tuple
+
+# 로깅 설정
+logger = logging.getLogger('arxiv_collector')
+
+class ArtifactStore:
+    """PDF/HTML/텍스트 파일을 내용 해시(SHA-256)로 저장하는 중복 제거 저장소입니다.
+
+    파일은 objects/<종류>/<해시 앞 2자리>/<해시>.<확장자>에 한 번만 저장되고,
+    SQLite 인덱스가 (종류, 이름) → 해시와 출처 URL을 기록합니다.
+    같은 내용은 이름이 달라도 디스크에 한 번만 저장되며, 텍스트와 HTML은 gzip으로 압축합니다.
+    """
+
+    # 종류별 (확장자, 압축 여부)
+    KINDS = {
+        'pdf': ('.pdf', False),
+        'html': ('.html.gz', True),
+        'text': ('.txt.gz', True),
+        'supplementary': ('.bin', False),
+    }
+
+    _HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, root_dir: Path):
+        self.root_dir = Path(root_dir)
+        self.objects_dir = self.root_dir / 'objects'
+        self.tmp_dir = self.root_dir / 'tmp'
+        self.partial_dir = self.root_dir / 'partial'
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        self.partial_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root_dir / 'index.db'), check_same_thread=False, isolation_level=None)
+        self._init_schema()
+
+    def _init_schema(self):
+        """인덱스 테이블을 생성합니다."""
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS artifacts (
+                    kind TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    sha256 TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    source TEXT,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (kind, name)
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_artifacts_sha256 ON artifacts (sha256)"
+            )
+
+    def object_path(self, kind: str, sha256: str) -> Path:
+        """해시에 해당하는 객체 파일 경로를 반환합니다."""
+        suffix, _ = self.KINDS[kind]
+        return self.objects_dir / kind / sha256[:2] / f"{sha256}{suffix}"
+
+    @classmethod
+    def hash_file(cls, path: Path) -> str:
+        """파일 내용의 SHA-256 해시를 반환합니다."""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(cls._HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def lookup(self, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        """인덱스 항목을 반환합니다. 없거나 객체 파일이 사라졌으면 None을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, size, source, updated_at FROM artifacts WHERE kind = ? AND name = ?",
+                (kind, name)
+            ).fetchone()
+        if row is None:
+            return None
+        path = self.object_path(kind, row[0])
+        if not path.exists():
+            return None
+        return {'sha256': row[0], 'size': row[1], 'source': row[2], 'updated_at': row[3], 'path': path}
+
+    def exists(self, kind: str, name: str, source: str = None) -> bool:
+        """항목이 저장되어 있는지 확인합니다. source를 지정하면 출처까지 같아야 합니다."""
+        entry = self.lookup(kind, name)
+        return entry is not None and (source is None or entry['source'] == source)
+
+    def _record(self, kind: str, name: str, sha256: str, size: int, source: str = None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO artifacts (kind, name, sha256, size, source, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, name, sha256, size, source, time.time())
+            )
+
+    def temp_file(self) -> BinaryIO:
+        """저장소와 같은 파일 시스템에 임시 파일을 엽니다. put_file로 옮길 때 복사가 필요 없습니다."""
+        return tempfile.NamedTemporaryFile(dir=self.tmp_dir, delete=False)
+
+    def partial_paths(self, source: str) -> Tuple[Path, Path]:
+        """이어받기 중인 다운로드의 (데이터 파일, 메타데이터 파일) 경로를 반환합니다."""
+        key = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        return self.partial_dir / f"{key}.part", self.partial_dir / f"{key}.json"
+
+    def put_file(self, kind: str, name: str, src_path: Path, source: str = None) -> str:
+        """파일을 저장소로 옮기고 해시를 반환합니다. 같은 내용이 이미 있으면 원본 파일만 삭제합니다."""
+        _, compressed = self.KINDS[kind]
+        src_path = Path(src_path)
+        sha256 = self.hash_file(src_path)
+        size = src_path.stat().st_size
+        path = self.object_path(kind, sha256)
+        if path.exists():
+            src_path.unlink()
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if compressed:
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(src_path, 'rb') as src, gzip.open(tmp_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, self._HASH_CHUNK_SIZE)
+                os.replace(tmp_path, path)
+                src_path.unlink()
+            else:
+                os.replace(src_path, path)
+        self._record(kind, name, sha256, size, source)
+        return sha256
+
+    def put_bytes(self, kind: str, name: str, data: bytes, source: str = None) -> str:
+        """바이트 데이터를 저장하고 해시를 반환합니다."""
+        with self.temp_file() as f:
+            f.write(data)
+        return self.put_file(kind, name, Path(f.name), source)
+
+    def put_text(self, kind: str, name: str, text: str, source: str = None) -> str:
+        """문자열을 UTF-8로 저장하고 해시를 반환합니다."""
+        return self.put_bytes(kind, name, text.encode('utf-8'), source)
+
+    def open(self, kind: str, name: str) -> Optional[BinaryIO]:
+        """저장된 내용을 (압축 해제된) 바이너리 스트림으로 엽니다. 없으면 None을 반환합니다."""
+        entry = self.lookup(kind, name)
+        if entry is None:
+            return None
+        _, compressed = self.KINDS[kind]
+        return gzip.open(entry['path'], 'rb') if compressed else open(entry['path'], 'rb')
+
+    def get_text(self, kind: str, name: str) -> Optional[str]:
+        """저장된 내용을 문자열로 반환합니다. 없으면 None을 반환합니다."""
+        f = self.open(kind, name)
+        if f is None:
+            return None
+        with f:
+            return f.read().decode('utf-8')
+
+    def prune(self) -> int:
+        """인덱스에서 참조하지 않는 객체 파일과 남은 임시 파일을 삭제하고 삭제 개수를 반환합니다. 수집 중에는 호출하지 않습니다."""
+        with self._lock:
+            referenced = {(kind, sha256) for kind, sha256 in self._conn.execute("SELECT kind, sha256 FROM artifacts")}
+        removed = 0
+        for kind in self.KINDS:
+            suffix, _ = self.KINDS[kind]
+            for path in (self.objects_dir / kind).glob(f"*/*{suffix}"):
+                if (kind, path.name[:-len(suffix)]) not in referenced:
+                    path.unlink()
+                    removed += 1
+        for path in self.tmp_dir.iterdir():
+            path.unlink()
+        return removed
+
+    def close(self):
+        """인덱스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
@@ -1,11 +1,12 @@
 import os
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import logging
 import pytz
-from bs4 import BeautifulSoup
 import re
 from pdfminer.high_level import extract_text
 from pdfminer.pdfparser import PDFSyntaxError
@@ -14,8 +15,18 @@ import warnings
 from pdfminer.pdfpage import PDFPage
 from tqdm import tqdm
 from pathlib import Path
-import io
+import sys
+import tempfile
 import urllib.parse
+import email.utils
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, Tuple, Optional
+from .http_cache import HTTPResponseCache
+from .artifact_store import ArtifactStore
+from .html_extraction import extract_article_html, extract_main_text
+from .rate_limiter import get_rate_limiter
+from .pdf_extraction import extract_pdf_text, extract_pdf_excerpt, iter_pdf_pages, extract_pdfs_parallel
 
 # PDF 경고 메시지 필터링
 warnings.filterwarnings('ignore', category=UserWarning, module='pdfminer.pdfpage')
@@ -25,8 +36,14 @@ warnings.filterwarnings('ignore', category=UserWarning, module='pdfminer.pdfpars
 # 로깅 설정
 logger = logging.getLogger('arxiv_collector')
 
+class IncompleteSearchError(Exception):
+    """검색 결과 페이지 요청이 실패해 이후 결과를 받지 못했을 때 발생합니다."""
+
 class ChemRxivCollector:
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, rate_limit: float = 2.0, rate_burst: float = 4,
+                 timeout: Tuple[float, float] = (10, 60),
+                 use_http_cache: bool = True, search_cache_ttl: float = 3600, show_progress: bool = None,
+                 download_supplementary: bool = False, supplementary_max_mb: float = 50):
         # 로거 초기화
         self.logger = logger
         
@@ -39,124 +56,320 @@ class ChemRxivCollector:
         
         # 디렉토리 설정
         self.base_dir = Path(__file__).parent.parent.parent
-        self.papers_dir = self.base_dir / 'data' / 'papers'
-        self.html_dir = self.base_dir / 'data' / 'html'
-        self.text_dir = self.base_dir / 'data' / 'text'
         
-        # 디렉토리 생성
-        self.papers_dir.mkdir(parents=True, exist_ok=True)
-        self.html_dir.mkdir(parents=True, exist_ok=True)
-        self.text_dir.mkdir(parents=True, exist_ok=True)
+        # PDF/HTML/텍스트 저장소 (내용 해시 기반, 중복 제거)
+        self.artifacts_dir = self.base_dir / 'data' / 'artifacts'
+        self.artifacts = ArtifactStore(self.artifacts_dir)
         
         # 재시도 설정
         self.max_retries = 3
         self.retry_delay = 2  # 초
+        self.retry_statuses = (429, 500, 502, 503, 504)  # 재시도할 응답 상태 코드
         self.max_papers = 50  # 최대 수집 논문 수
+        
+        # 다운로드 설정
+        self.download_chunk_size = 1024 * 1024  # 1 MiB
+        self.resume_chunk_size = 64 * 1024  # 이어받기 다운로드 청크 (연결이 끊기면 읽던 청크는 버려짐)
+        self.show_progress = sys.stderr.isatty() if show_progress is None else show_progress  # 데몬 실행 시 비활성화
+        self.download_supplementary = download_supplementary  # 보충 자료 다운로드 여부
+        self.supplementary_max_bytes = int(supplementary_max_mb * 1024 * 1024)  # 보충 자료 파일당 최대 크기
+        
+        # 동시 수집 설정
+        self.max_workers = max_workers
+        self.rate_limit = rate_limit  # 호스트별 초당 최대 요청 수
+        self.rate_burst = rate_burst  # 호스트별 최대 연속 요청 수
+        self.rate_limiter = get_rate_limiter()  # 프로세스 전체 공유 (호스트별 토큰 버킷)
+        
+        # HTTP 세션 (연결 풀 + keep-alive, 재시도는 _get에서 처리)
+        self.timeout = timeout  # (연결, 읽기) 제한 시간 (초)
+        self.session = self._create_session()
+        
+        # HTTP 응답 캐시 (ETag/Last-Modified 조건부 요청)
+        self.http_cache = HTTPResponseCache(self.base_dir / 'data' / 'http_cache') if use_http_cache else None
+        self.search_cache_ttl = search_cache_ttl  # 검색 API 응답을 서버 확인 없이 재사용할 시간 (초)
+        
+        # 증분 수집 설정 (검색어별 워터마크)
+        self.watermark_path = self.base_dir / 'data' / 'cache' / 'search_watermarks.json'
+        self._watermark_lock = threading.Lock()
+        self._watermarks = self._load_watermarks()
+        self._pending_watermarks = {}
 
-    def download_pdf(self, url: str, filename: str) -> bool:
-        """PDF 파일 다운로드"""
-        retry_count = 0
-        while retry_count < self.max_retries:
+    def _create_session(self) -> requests.Session:
+        """워커 수에 맞춘 연결 풀을 가진 세션을 생성합니다.
+
+        어댑터 수준 재시도는 속도 제한을 거치지 않으므로 사용하지 않습니다 (재시도는 _get에서 처리).
+        """
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(1, self.max_workers),
+            max_retries=Retry(total=0, raise_on_status=False)
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({"User-Agent": self.headers["User-Agent"]})
+        return session
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다. 없으면 None을 반환합니다."""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=pytz.UTC)
+        return max(0.0, (retry_at - datetime.now(pytz.UTC)).total_seconds())
+
+    def _get(self, url: str, retries: int = None, **kwargs) -> requests.Response:
+        """공유 세션으로 GET 요청을 보냅니다. 호스트별 속도 제한과 기본 제한 시간이 적용됩니다.
+
+        연결 오류와 retry_statuses 응답은 최대 retries번(기본 max_retries) 지수 백오프로 재시도하며,
+        Retry-After 헤더가 있으면 그 시간만큼 기다립니다. 재시도할 때마다 토큰을 다시 받으므로
+        재시도 요청도 속도 제한을 지킵니다. 마지막 시도의 오류 응답은 그대로 반환합니다.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        retries = self.max_retries if retries is None else retries
+        for attempt in range(retries + 1):
+            self.rate_limiter.acquire(url, self.rate_limit, self.rate_burst)
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= retries:
+                    raise
+                delay = self.retry_delay * (2 ** attempt)
+                reason = str(e)
+            else:
+                if response.status_code not in self.retry_statuses or attempt >= retries:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self.retry_delay * (2 ** attempt)
+                reason = f"HTTP {response.status_code}"
+                response.close()
+            self.logger.warning(f"요청 실패, {delay:.1f}초 후 재시도합니다 ({attempt + 1}/{retries}): {url} ({reason})")
+            time.sleep(delay)
+
+    def _get_cached(self, url: str, params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+                    ttl: float = None) -> requests.Response:
+        """HTTP 캐시를 거쳐 GET 요청을 보냅니다. 캐시를 사용하지 않으면 _get과 같습니다."""
+        if self.http_cache is None:
+            return self._get(url, params=params, headers=headers)
+        return self.http_cache.get(self._get, url, params=params, headers=headers, ttl=ttl)
+
+    def _stream_to_file(self, response: requests.Response, file_obj, desc: str, max_bytes: int = None,
+                        chunk_size: int = None) -> int:
+        """응답 본문을 큰 청크 단위로 파일에 기록하고 기록한 바이트 수를 반환합니다.
+
+        max_bytes를 넘으면 ValueError가 발생합니다.
+        """
+        total_size = int(response.headers.get('content-length', 0))
+        written = 0
+        with tqdm(
+            desc=desc,
+            total=total_size,
+            unit='iB',
+            unit_scale=True,
+            leave=False,  # 진행률 표시줄이 다음 줄에 남지 않도록 설정
+            disable=not (self.show_progress and self.logger.isEnabledFor(logging.INFO))
+        ) as pbar:
+            for chunk in response.iter_content(chunk_size=chunk_size or self.download_chunk_size):
+                if chunk:
+                    written += file_obj.write(chunk)
+                    pbar.update(len(chunk))
+                    if max_bytes and file_obj.tell() > max_bytes:
+                        raise ValueError(f"파일 크기가 제한({max_bytes} bytes)을 초과했습니다.")
+        return written
+
+    def _parse_content_range(self, value: str) -> Tuple[Optional[int], Optional[int]]:
+        """Content-Range 헤더(bytes 시작-끝/전체)에서 (시작 위치, 전체 크기)를 반환합니다."""
+        match = re.match(r'bytes\s+(\d+)-\d+/(\d+|\*)', value or '')
+        if not match:
+            return None, None
+        total = match.group(2)
+        return int(match.group(1)), (int(total) if total != '*' else None)
+
+    def _download_resumable(self, url: str, name: str, kind: str = 'pdf', max_bytes: int = None) -> bool:
+        """HTTP Range 요청으로 이어받기가 가능한 다운로드를 수행하고 저장소에 저장합니다.
+
+        받은 부분은 partial 디렉토리에 남겨 두고, 재시도(또는 다음 실행) 시
+        ETag/Last-Modified가 같으면(If-Range) 남은 바이트만 요청합니다.
+        재시도는 최대 max_retries번이며, 요청 수준 재시도(_get)는 사용하지 않습니다.
+        완료 후 크기를 Content-Length(또는 Content-Range 전체 크기)와 비교합니다.
+        """
+        part_path, meta_path = self.artifacts.partial_paths(url)
+        
+        for attempt in range(self.max_retries + 1):
+            # 이전에 받은 부분 확인
+            meta = {}
+            if part_path.exists() and meta_path.exists():
+                try:
+                    with open(meta_path, 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                except (IOError, json.JSONDecodeError):
+                    meta = {}
+            offset = part_path.stat().st_size if meta.get('validator') else 0
+            
+            headers = {}
+            if offset:
+                headers['Range'] = f"bytes={offset}-"
+                headers['If-Range'] = meta['validator']
+            
             try:
-                response = requests.get(url, stream=True)
-                response.raise_for_status()
-                total_size = int(response.headers.get('content-length', 0))
+                # 재시도는 이 반복문에서만 수행 (_get 재시도와 겹치지 않도록)
+                with self._get(url, retries=0, headers=headers, stream=True) as response:
+                    if response.status_code == 416:
+                        # 요청 범위가 잘못됨: 처음부터 다시 받음
+                        part_path.unlink(missing_ok=True)
+                        meta_path.unlink(missing_ok=True)
+                        continue
+                    response.raise_for_status()
+                    
+                    start, total = None, None
+                    if response.status_code == 206:
+                        start, total = self._parse_content_range(response.headers.get('Content-Range'))
+                    if start != offset or start is None:
+                        # 서버가 Range를 무시했거나 파일이 바뀜: 처음부터 기록
+                        offset = 0
+                        total = int(response.headers['Content-Length']) if 'Content-Length' in response.headers else None
+                    elif offset:
+                        self.logger.info(f"{name}: {offset} bytes 이후부터 이어받습니다.")
+                    
+                    if max_bytes and total and total > max_bytes:
+                        self.logger.warning(f"{name}: 파일 크기({total} bytes)가 제한을 초과하여 건너뜁니다.")
+                        return False
+                    
+                    meta = {
+                        'url': url,
+                        'total': total,
+                        'validator': response.headers.get('ETag') or response.headers.get('Last-Modified')
+                    }
+                    with open(meta_path, 'w', encoding='utf-8') as f:
+                        json.dump(meta, f)
+                    
+                    with open(part_path, 'ab' if offset else 'wb') as file:
+                        self._stream_to_file(response, file, name, max_bytes, self.resume_chunk_size)
+                
+                # 무결성 확인
+                size = part_path.stat().st_size
+                if total is not None and size != total:
+                    raise IOError(f"받은 크기({size} bytes)가 예상 크기({total} bytes)와 다릅니다.")
                 
-                filepath = self.papers_dir / filename
-                with open(filepath, 'wb') as file, tqdm(
-                    desc=filename,
-                    total=total_size,
-                    unit='iB',
-                    unit_scale=True,
-                    leave=False,  # 진행률 표시줄이 다음 줄에 남지 않도록 설정
-                    disable=not self.logger.isEnabledFor(logging.INFO)  # 로깅 레벨이 INFO 이상일 때만 진행률 표시
-                ) as pbar:
-                    for data in response.iter_content(chunk_size=1024):
-                        size = file.write(data)
-                        pbar.update(size)
+                self.artifacts.put_file(kind, name, part_path, source=url)
+                meta_path.unlink(missing_ok=True)
                 return True
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"PDF 다운로드 중 네트워크 오류 발생 (시도 {retry_count + 1}/{self.max_retries}): {str(e)}")
-                retry_count += 1
-                if retry_count < self.max_retries:
-                    time.sleep(self.retry_delay)
-            except IOError as e:
-                self.logger.error(f"PDF 파일 저장 중 오류 발생 (시도 {retry_count + 1}/{self.max_retries}): {str(e)}")
-                retry_count += 1
-                if retry_count < self.max_retries:
-                    time.sleep(self.retry_delay)
-            except Exception as e:
-                self.logger.error(f"PDF 다운로드 중 예상치 못한 오류 발생 (시도 {retry_count + 1}/{self.max_retries}): {str(e)}")
-                retry_count += 1
-                if retry_count < self.max_retries:
-                    time.sleep(self.retry_delay)
+            except ValueError as e:
+                self.logger.warning(f"{name}: {e}")
+                part_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                return False
+            except (requests.exceptions.RequestException, IOError) as e:
+                if attempt < self.max_retries:
+                    self.logger.warning(f"{name} 다운로드 중단, 재시도합니다 ({attempt + 1}/{self.max_retries}): {e}")
+                    time.sleep(self.retry_delay * (2 ** attempt))
+                else:
+                    self.logger.error(f"{name} 다운로드 실패: {e}")
         return False
 
+    def download_pdf(self, url: str, filename: str) -> bool:
+        """PDF 파일 다운로드 (같은 URL로 이미 저장된 파일은 다시 받지 않고, 중단된 다운로드는 이어받음)"""
+        if self.artifacts.exists('pdf', filename, source=url):
+            self.logger.debug(f"이미 저장된 PDF입니다: {filename}")
+            return True
+        
+        try:
+            return self._download_resumable(url, filename, 'pdf')
+        except Exception as e:
+            self.logger.error(f"PDF 다운로드 중 예상치 못한 오류 발생: {str(e)}")
+        return False
+
+    def download_supplementary_materials(self, paper: Dict[str, Any]) -> Dict[str, bool]:
+        """논문의 보충 자료를 다운로드합니다. download_supplementary가 켜진 경우에만 동작합니다.
+
+        파일당 supplementary_max_bytes를 넘는 자료는 건너뛰며, {URL: 성공 여부}를 반환합니다.
+        """
+        if not self.download_supplementary:
+            return {}
+        
+        results = {}
+        for item in paper.get('supplementary_materials', []):
+            url = item['url']
+            name = f"{paper.get('id', '')}/{Path(urllib.parse.urlparse(url).path).name}"
+            if self.artifacts.exists('supplementary', name, source=url):
+                results[url] = True
+                continue
+            try:
+                results[url] = self._download_resumable(url, name, 'supplementary', self.supplementary_max_bytes)
+            except Exception as e:
+                self.logger.error(f"보충 자료 다운로드 중 예상치 못한 오류 발생 ({url}): {e}")
+                results[url] = False
+        return results
+
+    def get_pdf_path(self, filename: str) -> Optional[Path]:
+        """저장된 PDF 파일 경로를 반환합니다. 없으면 None을 반환합니다."""
+        entry = self.artifacts.lookup('pdf', filename)
+        return entry['path'] if entry else None
+
     def download_html(self, paper_id: str) -> bool:
         """HTML 버전 논문 다운로드 및 저장"""
-        retry_count = 0
-        while retry_count < self.max_retries:
-            try:
-                html_url = f"https://chemrxiv.org/engage/chemrxiv/article-details/{paper_id}"
-                
-                response = requests.get(html_url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 메타데이터 제거
-                for element in soup.find_all(['script', 'style', 'nav', 'header', 'footer']):
-                    element.decompose()
-                
-                # 본문 추출
-                main_content = soup.find('article')
-                if not main_content:
-                    self.logger.warning(f"본문을 찾을 수 없음: {html_url}")
-                    return False
-                
-                # 이미지 URL 수정
-                for img in main_content.find_all('img'):
-                    if img.get('src', '').startswith('/'):
-                        img['src'] = f"https://chemrxiv.org{img['src']}"
-                
-                # 파일명 생성
-                filename = f"{paper_id}.html"
-                
-                # HTML 저장
-                filepath = self.html_dir / filename
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(str(main_content))
-                
+        try:
+            html_url = f"https://chemrxiv.org/engage/chemrxiv/article-details/{paper_id}"
+            if self.artifacts.exists('html', paper_id, source=html_url):
+                self.logger.debug(f"이미 저장된 HTML입니다: {paper_id}")
                 return True
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"HTML 다운로드 중 네트워크 오류 발생 (시도 {retry_count + 1}/{self.max_retries}): {str(e)}")
-                retry_count += 1
-                if retry_count < self.max_retries:
-                    time.sleep(self.retry_delay)
-            except IOError as e:
-                self.logger.error(f"HTML 파일 저장 중 오류 발생 (시도 {retry_count + 1}/{self.max_retries}): {str(e)}")
-                retry_count += 1
-                if retry_count < self.max_retries:
-                    time.sleep(self.retry_delay)
-            except Exception as e:
-                self.logger.error(f"HTML 다운로드 중 예상치 못한 오류 발생 (시도 {retry_count + 1}/{self.max_retries}): {str(e)}")
-                retry_count += 1
-                if retry_count < self.max_retries:
-                    time.sleep(self.retry_delay)
+            
+            response = self._get_cached(html_url)
+            response.raise_for_status()
+            
+            # 본문 추출 (메타데이터 제거, 이미지 URL 수정)
+            main_content = extract_article_html(response.content, response.headers.get('Content-Type'))
+            if not main_content:
+                self.logger.warning(f"본문을 찾을 수 없음: {html_url}")
+                return False
+            
+            # HTML 저장 (같은 내용이면 새로 쓰지 않음)
+            self.artifacts.put_text('html', paper_id, main_content, source=html_url)
+            
+            return True
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"HTML 다운로드 중 네트워크 오류 발생: {str(e)}")
+        except IOError as e:
+            self.logger.error(f"HTML 파일 저장 중 오류 발생: {str(e)}")
+        except Exception as e:
+            self.logger.error(f"HTML 다운로드 중 예상치 못한 오류 발생: {str(e)}")
         return False
 
-    def extract_text_from_pdf(self, pdf_path: str, output_path: str) -> bool:
-        """PDF에서 텍스트 추출"""
+    def _text_key(self, pdf_path: str, max_pages: int = None, max_chars: int = None) -> str:
+        """PDF 내용 해시와 추출 범위로 텍스트 저장 키를 생성합니다."""
+        return f"{ArtifactStore.hash_file(Path(pdf_path))}:{max_pages or 0}:{max_chars or 0}"
+
+    def extract_text_from_pdf(self, pdf_path: str, output_path: str = None, max_pages: int = None,
+                              max_chars: int = None) -> bool:
+        """PDF에서 텍스트 추출 (max_pages/max_chars 지정 시 앞쪽 페이지만 추출)
+
+        추출 결과는 저장소에 압축 저장되며, 같은 내용의 PDF는 다시 추출하지 않습니다.
+        output_path를 지정하면 텍스트를 해당 경로에도 기록합니다.
+        """
         try:
-            text = extract_text(pdf_path)
-            
-            # 텍스트 정리
-            text = re.sub(r'\s+', ' ', text)  # 연속된 공백 제거
-            text = text.strip()
+            text_key = self._text_key(pdf_path, max_pages, max_chars)
+            text = self.artifacts.get_text('text', text_key)
+            if text is None:
+                if max_pages or max_chars:
+                    excerpt = extract_pdf_excerpt(pdf_path, max_pages, max_chars)
+                    text = excerpt['text']
+                    self.logger.info(f"PDF 전체 {excerpt['page_count']}쪽 중 {excerpt['pages_extracted']}쪽을 추출했습니다: {pdf_path}")
+                else:
+                    text = extract_pdf_text(pdf_path)
+                self.artifacts.put_text('text', text_key, text, source=str(pdf_path))
             
             # 파일 저장
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            if output_path:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
             
             return True
         except PDFSyntaxError as e:
@@ -169,7 +382,244 @@ class ChemRxivCollector:
             self.logger.error(f"PDF 텍스트 추출 중 예상치 못한 오류 발생: {str(e)}")
             return False
 
-    def collect(self, search_options: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+    def get_pdf_text(self, pdf_path: str, max_pages: int = None, max_chars: int = None) -> Optional[str]:
+        """저장소에 있는 추출 텍스트를 반환합니다. 아직 추출하지 않았으면 None을 반환합니다."""
+        return self.artifacts.get_text('text', self._text_key(pdf_path, max_pages, max_chars))
+
+    def iter_pdf_text(self, pdf_path: str, max_pages: int = None) -> Iterator[str]:
+        """PDF 텍스트를 페이지 단위로 하나씩 반환합니다. 필요한 만큼만 읽고 중단할 수 있습니다."""
+        return iter_pdf_pages(pdf_path, max_pages)
+
+    def extract_pdf_excerpt(self, pdf_path: str, max_pages: int = None, max_chars: int = None) -> Dict[str, Any]:
+        """앞쪽 페이지 텍스트와 추출/전체 페이지 수를 반환합니다. 실패하면 빈 텍스트를 반환합니다."""
+        try:
+            return extract_pdf_excerpt(pdf_path, max_pages, max_chars)
+        except Exception as e:
+            self.logger.error(f"PDF 텍스트 추출 중 오류 발생 ({pdf_path}): {e}")
+            return {'text': '', 'pages_extracted': 0, 'page_count': 0}
+
+    def extract_texts_from_pdfs(self, pdf_paths: List[str], max_workers: int = None, timeout: float = 120,
+                                memory_limit_mb: int = 2048, max_pages: int = None,
+                                max_chars: int = None) -> Dict[str, bool]:
+        """여러 PDF의 텍스트를 프로세스 풀에서 병렬로 추출해 저장소에 압축 저장합니다.
+
+        문서마다 시간 제한(timeout초)과 워커 메모리 한도(memory_limit_mb)가 적용되며,
+        한 문서의 실패나 워커 비정상 종료가 다른 문서에 영향을 주지 않습니다.
+        """
+        # 이미 추출된 PDF(같은 내용 + 같은 추출 범위)는 건너뜀
+        results = {}
+        jobs = []
+        text_keys = {}
+        for pdf_path in pdf_paths:
+            pdf_path = str(pdf_path)
+            text_keys[pdf_path] = self._text_key(pdf_path, max_pages, max_chars)
+            if self.artifacts.exists('text', text_keys[pdf_path]):
+                results[pdf_path] = True
+            else:
+                jobs.append((pdf_path, str(self.artifacts.tmp_dir / f"{text_keys[pdf_path].replace(':', '_')}.txt")))
+        
+        if results:
+            self.logger.info(f"PDF {len(results)}개는 이미 추출되어 건너뜁니다.")
+        if not jobs:
+            return results
+        self.logger.info(f"PDF {len(jobs)}개의 텍스트를 병렬로 추출합니다.")
+        
+        extracted = extract_pdfs_parallel(
+            jobs,
+            max_workers=max_workers,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            max_pages=max_pages,
+            max_chars=max_chars
+        )
+        
+        outputs = dict(jobs)
+        for pdf_path, (success, error) in extracted.items():
+            output_path = Path(outputs[pdf_path])
+            if success:
+                self.artifacts.put_file('text', text_keys[pdf_path], output_path, source=pdf_path)
+            else:
+                self.logger.error(f"PDF 텍스트 추출 실패 ({pdf_path}): {error}")
+                if output_path.exists():
+                    output_path.unlink()
+            results[pdf_path] = success
+        return results
+
+    def _parse_datetime(self, value: str) -> Optional[datetime]:
+        """ISO 8601 형식의 날짜 문자열을 UTC datetime으로 변환합니다."""
+        if not value:
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except (TypeError, ValueError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=pytz.UTC)
+        return parsed
+
+    def _normalize_paper(self, paper: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """API 응답의 논문 항목을 표준 형식으로 변환합니다."""
+        # ID 처리
+        paper_id = paper.get('id', '')
+        if not paper_id:
+            self.logger.warning("ID가 없는 논문을 건너뜁니다.")
+            return None
+        
+        # URL 생성
+        url = f"https://chemrxiv.org/engage/chemrxiv/article-details/{paper_id}"
+        
+        # authors 처리
+        authors = []
+        for author in paper.get('authors', []):
+            name = f"{author.get('firstName', '')} {author.get('lastName', '')}".strip()
+            if name:
+                authors.append(name)
+        
+        # categories 처리
+        categories = []
+        for cat in paper.get('categories', []):
+            if isinstance(cat, dict) and cat.get('name'):
+                categories.append(cat['name'])
+            elif isinstance(cat, str):
+                categories.append(cat)
+        
+        # asset 처리
+        asset = paper.get('asset', {})
+        pdf_url = asset.get('original', {}).get('url', '') if asset else ''
+        
+        # metrics 처리
+        metrics = {}
+        for metric in paper.get('metrics', []):
+            if isinstance(metric, dict) and metric.get('description') and metric.get('value') is not None:
+                metrics[metric['description'].lower().replace(' ', '_')] = metric['value']
+        
+        # suppItems 처리
+        supp_items = []
+        for supp in paper.get('suppItems', []):
+            if isinstance(supp, dict) and supp.get('title') and supp.get('asset', {}).get('original', {}).get('url'):
+                supp_items.append({
+                    'title': supp['title'],
+                    'url': supp['asset']['original']['url']
+                })
+        
+        processed_paper = {
+            'id': paper_id,
+            'title': paper.get('title', ''),
+            'authors': authors,
+            'abstract': paper.get('abstract', ''),
+            'submission_date': paper.get('submittedDate', paper.get('publishedDate', '')),
+            'published_date': paper.get('publishedDate', ''),
+            'categories': categories,
+            'html_url': url,
+            'doi': paper.get('doi', ''),
+            'pdf_url': pdf_url,
+            'license': paper.get('license', {}).get('name', ''),
+            'version': paper.get('version', ''),
+            'is_latest_version': paper.get('isLatestVersion', False),
+            'keywords': paper.get('keywords', []),
+            'metrics': metrics,
+            'content_type': paper.get('contentType', {}).get('name', ''),
+            'status': paper.get('status', ''),
+            'funders': [f.get('name', '') for f in paper.get('funders', []) if f.get('name')],
+            'supplementary_materials': supp_items,
+            'subject': paper.get('subject', {}).get('name', ''),
+            'event': paper.get('event', {}).get('name', '') if paper.get('event') else None
+        }
+        
+        self.logger.debug(f"처리된 논문 데이터: {json.dumps(processed_paper, indent=2)}")
+        return processed_paper
+
+    def _day_aligned_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """검색 기간을 일 단위로 맞춥니다. searchDateFrom은 그날 0시로 내리고 searchDateTo는 다음 날 0시로 올립니다.
+
+        실행 시각(초 단위)이 그대로 들어가면 실행마다 URL이 달라져 HTTP 캐시가 적중하지 않습니다.
+        넓어진 시작 구간의 논문은 iter_search가 원래의 searchDateFrom 기준으로 걸러냅니다.
+        """
+        aligned = dict(params)
+        for name, next_day in (("searchDateFrom", False), ("searchDateTo", True)):
+            value = self._parse_datetime(aligned.get(name, ""))
+            if value is None:
+                continue
+            day = value.astimezone(pytz.UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+            if next_day and day != value:
+                day += timedelta(days=1)
+            aligned[name] = day.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return aligned
+
+    def _request_page(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """검색 API의 한 페이지를 요청합니다. 실패하면 None을 반환합니다."""
+        response = self._get_cached(
+            self.base_url,
+            params=self._day_aligned_params(params),
+            headers=self.headers,
+            ttl=self.search_cache_ttl
+        )
+        
+        if response.status_code != 200:
+            self.logger.error(f"API 요청 실패: {response.status_code}")
+            self.logger.error(f"응답 내용: {response.text}")
+            return None
+        
+        return response.json()
+
+    def iter_search(self, search_options: Dict[str, Any], max_results: int = None) -> Iterator[Dict[str, Any]]:
+        """skip/limit으로 검색 결과를 페이지 단위로 요청하며, 표준화된 논문을 도착하는 대로 반환합니다.
+
+        날짜 내림차순 정렬에서 searchDateFrom 이전 논문이 나오거나,
+        max_results개를 반환했거나, 마지막 페이지에 도달하면 중단합니다.
+        페이지 요청이 실패하면 IncompleteSearchError를 발생시킵니다.
+        """
+        params = dict(search_options)
+        page_size = int(params.get("limit") or self.max_papers)
+        skip = int(params.get("skip") or 0)
+        date_from = self._parse_datetime(params.get("searchDateFrom", ""))
+        sorted_by_date = str(params.get("sort", "")).endswith("DATE_DESC")
+        date_field = "submittedDate" if "SUBMITTED" in str(params.get("sort", "")) else "publishedDate"
+        
+        yielded = 0
+        while True:
+            params["skip"] = skip
+            params["limit"] = page_size
+            data = self._request_page(params)
+            if data is None:
+                raise IncompleteSearchError(f"검색 페이지 요청 실패 (skip={skip})")
+            
+            item_hits = data.get('itemHits', [])
+            self.logger.info(f"검색 페이지 수신 (skip={skip}): {len(item_hits)}개 / 전체 {data.get('totalCount', 'N/A')}개")
+            
+            for item_hit in item_hits:
+                paper = item_hit.get('item', {})
+                if not paper or not paper.get('title'):  # 제목이 있는 논문만 처리
+                    continue
+                
+                # 날짜 범위를 벗어나면 이후 결과도 모두 범위 밖
+                if sorted_by_date and date_from:
+                    paper_date = self._parse_datetime(paper.get(date_field, ""))
+                    if paper_date and paper_date < date_from:
+                        self.logger.info("검색 시작일 이전 논문에 도달하여 검색을 중단합니다.")
+                        return
+                
+                processed_paper = self._normalize_paper(paper)
+                if processed_paper is None:
+                    continue
+                
+                yield processed_paper
+                yielded += 1
+                if max_results is not None and yielded >= max_results:
+                    return
+            
+            skip += len(item_hits)
+            total_count = data.get('totalCount')
+            if len(item_hits) < page_size or (isinstance(total_count, int) and skip >= total_count):
+                return
+
+    def collect(self, search_options: Dict[str, Any] = None, max_results: int = None) -> List[Dict[str, Any]]:
+        papers, _ = self._collect(search_options, max_results)
+        return papers
+
+    def _collect(self, search_options: Dict[str, Any] = None, max_results: int = None
+                 ) -> Tuple[List[Dict[str, Any]], bool]:
+        """(논문 목록, 전체 페이지 수집 여부)를 반환합니다. 중간 페이지가 실패하면 받은 논문까지만 반환합니다."""
         try:
             if search_options is None:
                 search_options = {}
@@ -178,128 +628,253 @@ class ChemRxivCollector:
             search_term = search_options.get("term", "")
             if not search_term:
                 self.logger.error("검색어가 지정되지 않았습니다.")
-                return []
+                return [], False
                 
             self.logger.info(f"검색어: {search_term}")
             self.logger.info(f"검색 옵션: {search_options}")
             
-            # API 요청
-            response = requests.get(
-                self.base_url,
-                params=search_options,
-                headers=self.headers
-            )
-            
-            if response.status_code != 200:
-                self.logger.error(f"API 요청 실패: {response.status_code}")
-                self.logger.error(f"응답 내용: {response.text}")
-                return []
-                
-            data = response.json()
-            self.logger.info(f"API 응답 구조: {list(data.keys())}")
-            
-            # 논문 데이터 추출
-            papers = []
-            for item_hit in data.get('itemHits', []):
-                paper = item_hit.get('item', {})
-                if paper and paper.get('title'):  # 제목이 있는 논문만 추가
-                    papers.append(paper)
+            # 전체 페이지 수집
+            processed_papers = []
+            complete = True
+            try:
+                for paper in self.iter_search(search_options, max_results=max_results):
+                    processed_papers.append(paper)
+            except (IncompleteSearchError, requests.exceptions.RequestException) as e:
+                complete = False
+                self.logger.warning(f"검색어 '{search_term}'의 결과를 일부만 수집했습니다 ({len(processed_papers)}개): {e}")
             
-            self.logger.info(f"검색된 논문 수: {len(papers)}")
+            self.logger.info(f"검색된 논문 수: {len(processed_papers)}")
             
-            if not papers:
+            if not processed_papers:
                 self.logger.warning("검색 결과가 없습니다.")
-                return []
+                return [], complete
             
             # 검색 결과 로깅
-            for paper in papers[:5]:  # 처음 5개만 로깅
+            for paper in processed_papers[:5]:  # 처음 5개만 로깅
                 self.logger.info(f"제목: {paper.get('title', 'N/A')}")
                 self.logger.info(f"ID: {paper.get('id', 'N/A')}")
                 self.logger.info(f"DOI: {paper.get('doi', 'N/A')}")
-                author_names = [f"{a.get('firstName', '')} {a.get('lastName', '')}".strip() for a in paper.get('authors', [])]
-                self.logger.info(f"저자: {author_names}")
-                
-            # 논문 형식 표준화
-            processed_papers = []
-            for paper in papers:
-                # ID 처리
-                paper_id = paper.get('id', '')
-                if not paper_id:
-                    self.logger.warning("ID가 없는 논문을 건너뜁니다.")
-                    continue
-                
-                # URL 생성
-                url = f"https://chemrxiv.org/engage/chemrxiv/article-details/{paper_id}"
+                self.logger.info(f"저자: {paper.get('authors', [])}")
                 
-                # authors 처리
-                authors = []
-                for author in paper.get('authors', []):
-                    name = f"{author.get('firstName', '')} {author.get('lastName', '')}".strip()
-                    if name:
-                        authors.append(name)
-                
-                # categories 처리
-                categories = []
-                for cat in paper.get('categories', []):
-                    if isinstance(cat, dict) and cat.get('name'):
-                        categories.append(cat['name'])
-                    elif isinstance(cat, str):
-                        categories.append(cat)
-                
-                # asset 처리
-                asset = paper.get('asset', {})
-                pdf_url = asset.get('original', {}).get('url', '') if asset else ''
-                
-                # metrics 처리
-                metrics = {}
-                for metric in paper.get('metrics', []):
-                    if isinstance(metric, dict) and metric.get('description') and metric.get('value') is not None:
-                        metrics[metric['description'].lower().replace(' ', '_')] = metric['value']
-                
-                # suppItems 처리
-                supp_items = []
-                for supp in paper.get('suppItems', []):
-                    if isinstance(supp, dict) and supp.get('title') and supp.get('asset', {}).get('original', {}).get('url'):
-                        supp_items.append({
-                            'title': supp['title'],
-                            'url': supp['asset']['original']['url']
-                        })
-                
-                processed_paper = {
-                    'id': paper_id,
-                    'title': paper.get('title', ''),
-                    'authors': authors,
-                    'abstract': paper.get('abstract', ''),
-                    'submission_date': paper.get('submittedDate', paper.get('publishedDate', '')),
-                    'categories': categories,
-                    'html_url': url,
-                    'doi': paper.get('doi', ''),
-                    'pdf_url': pdf_url,
-                    'license': paper.get('license', {}).get('name', ''),
-                    'version': paper.get('version', ''),
-                    'is_latest_version': paper.get('isLatestVersion', False),
-                    'keywords': paper.get('keywords', []),
-                    'metrics': metrics,
-                    'content_type': paper.get('contentType', {}).get('name', ''),
-                    'status': paper.get('status', ''),
-                    'funders': [f.get('name', '') for f in paper.get('funders', []) if f.get('name')],
-                    'supplementary_materials': supp_items,
-                    'subject': paper.get('subject', {}).get('name', ''),
-                    'event': paper.get('event', {}).get('name', '') if paper.get('event') else None
-                }
-                
-                self.logger.info(f"처리된 논문 데이터: {json.dumps(processed_paper, indent=2)}")
-                processed_papers.append(processed_paper)
-                
-            if not processed_papers:
-                self.logger.warning("처리된 논문이 없습니다.")
-                return []
-                
-            return processed_papers
+            return processed_papers, complete
             
         except Exception as e:
             self.logger.error(f"논문 수집 중 오류 발생: {e}")
-            return []
+            return [], False
+
+    def _load_watermarks(self) -> Dict[str, Dict[str, Any]]:
+        """저장된 검색어별 워터마크를 로드합니다."""
+        if not self.watermark_path.exists():
+            return {}
+        try:
+            with open(self.watermark_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            self.logger.error(f"워터마크 로드 중 오류 발생: {e}")
+            return {}
+
+    def _stage_watermark(self, term: str, papers: List[Dict[str, Any]]):
+        """수집된 논문 중 가장 최근 게시일과 그 시각의 ID들을 새 워터마크로 준비합니다."""
+        latest_date = None
+        latest_ids = []
+        for paper in papers:
+            paper_date = self._parse_datetime(paper.get('published_date', ''))
+            if paper_date is None:
+                continue
+            if latest_date is None or paper_date > latest_date:
+                latest_date = paper_date
+                latest_ids = [paper['id']]
+            elif paper_date == latest_date:
+                latest_ids.append(paper['id'])
+        
+        if latest_date is None:
+            return
+        
+        with self._watermark_lock:
+            current = self._pending_watermarks.get(term) or self._watermarks.get(term)
+            current_date = self._parse_datetime(current['date']) if current else None
+            if current_date and current_date > latest_date:
+                return
+            if current_date == latest_date:
+                latest_ids = sorted(set(latest_ids) | set(current.get('ids', [])))
+            self._pending_watermarks[term] = {
+                'date': latest_date.isoformat(),
+                'ids': latest_ids
+            }
+
+    def commit_watermarks(self):
+        """준비된 워터마크를 저장합니다. 수집 결과 처리가 끝난 뒤 호출해야 합니다."""
+        with self._watermark_lock:
+            if not self._pending_watermarks:
+                return
+            self._watermarks.update(self._pending_watermarks)
+            self._pending_watermarks = {}
+            watermarks = dict(self._watermarks)
+        
+        try:
+            self.watermark_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.watermark_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(watermarks, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.watermark_path)
+            self.logger.info(f"검색어 워터마크를 저장했습니다: {self.watermark_path}")
+        except IOError as e:
+            self.logger.error(f"워터마크 저장 중 오류 발생: {e}")
+
+    def collect_incremental(self, search_options: Dict[str, Any], force_full: bool = False) -> List[Dict[str, Any]]:
+        """검색어별 워터마크 이후에 게시된 논문만 수집합니다. force_full이면 전체 기간을 다시 수집합니다.
+
+        일부 페이지를 받지 못한 경우 워터마크는 갱신하지 않습니다.
+        """
+        term = search_options.get("term", "")
+        with self._watermark_lock:
+            watermark = None if force_full else self._watermarks.get(term)
+        
+        options = dict(search_options)
+        watermark_date = self._parse_datetime(watermark['date']) if watermark else None
+        if watermark_date:
+            window_from = self._parse_datetime(options.get("searchDateFrom", ""))
+            if window_from is None or watermark_date > window_from:
+                options["searchDateFrom"] = watermark_date.strftime("%Y-%m-%dT%H:%M:%SZ")
+                self.logger.info(f"검색어 '{term}' 증분 수집: {options['searchDateFrom']} 이후")
+        
+        papers, complete = self._collect(options)
+        
+        # 워터마크 시점까지 이미 처리한 논문 제외
+        if watermark_date:
+            seen_ids = set(watermark.get('ids', []))
+            new_papers = []
+            for paper in papers:
+                paper_date = self._parse_datetime(paper.get('published_date', ''))
+                if paper_date and (paper_date < watermark_date or (paper_date == watermark_date and paper['id'] in seen_ids)):
+                    continue
+                new_papers.append(paper)
+            papers = new_papers
+        
+        # 일부 페이지가 누락되면 누락된(더 오래된) 논문을 다음 실행에서 다시 받도록 워터마크를 유지
+        if complete:
+            self._stage_watermark(term, papers)
+        else:
+            self.logger.warning(f"검색어 '{term}' 수집이 완료되지 않아 워터마크를 갱신하지 않습니다.")
+        return papers
+
+    @staticmethod
+    def _term_phrase(term: str) -> str:
+        """검색어에서 따옴표를 제거하고 소문자/단일 공백으로 정규화합니다."""
+        return re.sub(r'\s+', ' ', term.strip().strip('"')).lower()
+
+    @staticmethod
+    def _contains_phrase(text: str, phrase: str) -> bool:
+        """text에 phrase가 단어 경계 기준으로 포함되어 있는지 확인합니다."""
+        return re.search(rf'(?<!\w){re.escape(phrase)}(?!\w)', text) is not None
+
+    @staticmethod
+    def _is_quoted(term: str) -> bool:
+        term = term.strip()
+        return len(term) > 1 and term.startswith('"') and term.endswith('"')
+
+    def _term_key(self, term: str) -> Tuple[bool, str]:
+        """(따옴표 구문 여부, 정규화된 구문). 키가 같은 검색어는 같은 결과를 반환합니다."""
+        return self._is_quoted(term), self._term_phrase(term)
+
+    def plan_queries(self, terms: List[str]) -> Dict[str, List[str]]:
+        """검색어를 묶어 {실제로 검색할 검색어: 그 결과로 함께 처리되는 검색어 목록}을 반환합니다.
+
+        따옴표 구문 A가 다른 따옴표 구문 B를 포함하면(예: "CO2 reduction Cu" ⊃ "CO2 reduction")
+        A의 검색 결과는 B의 결과에 모두 포함되므로 B만 검색합니다.
+        따옴표가 없는 검색어는 합치지 않으며, 대소문자/공백만 다른 같은 검색어는 처음 나온 검색어에 배정합니다.
+        """
+        first = {}  # 검색어 키 → 처음 나온 검색어
+        duplicates = {}  # 중복 검색어 → 처음 나온 검색어
+        for term in dict.fromkeys(terms):
+            key = self._term_key(term)
+            if not key[1]:
+                continue
+            if key in first:
+                duplicates[term] = first[key]
+            else:
+                first[key] = term
+        phrases = {term: phrase for (_, phrase), term in first.items()}
+        quoted = {term for (is_quoted, _), term in first.items() if is_quoted}
+        
+        def covering(term: str) -> List[str]:
+            if term not in quoted:
+                return []
+            return [
+                other for other in quoted
+                if other != term and self._contains_phrase(phrases[term], phrases[other])
+            ]
+        
+        plan = {term: [term] for term in phrases if not covering(term)}
+        roots = {term: term for term in plan}
+        for term in phrases:
+            if term in plan:
+                continue
+            # 가장 짧은(가장 넓은) 검색어에 배정
+            root = min((other for other in covering(term) if other in plan), key=lambda other: len(phrases[other]))
+            plan[root].append(term)
+            roots[term] = root
+        for term, original in duplicates.items():
+            plan[roots[original]].append(term)
+        return plan
+
+    def _match_terms(self, paper: Dict[str, Any], terms: List[str], same_as: str = None) -> List[str]:
+        """제목/초록/키워드에 구문이 나타나는 검색어 목록을 반환합니다. same_as와 같은 검색어는 항상 포함합니다."""
+        text = ' '.join([paper.get('title', ''), paper.get('abstract', ''), ' '.join(paper.get('keywords', []))])
+        text = re.sub(r'\s+', ' ', text).lower()
+        same_key = self._term_key(same_as) if same_as else None
+        return [
+            term for term in terms
+            if self._term_key(term) == same_key or self._contains_phrase(text, self._term_phrase(term))
+        ]
+
+    def collect_terms(self, terms: List[str], search_options: Dict[str, Any], max_workers: int = None,
+                      incremental: bool = False, force_full: bool = False) -> List[Dict[str, Any]]:
+        """여러 검색어를 최소한의 검색으로 수집하고, 각 논문에 일치한 검색어를 'matched_terms'로 기록합니다.
+
+        search_options는 term을 제외한 공통 검색 옵션입니다. 논문은 ID 기준으로 중복 제거됩니다.
+        """
+        plan = self.plan_queries(terms)
+        self.logger.info(f"검색어 {len(terms)}개를 {len(plan)}개 검색으로 통합했습니다: {list(plan)}")
+        
+        options_list = [dict(search_options, term=term) for term in plan]
+        papers_by_id = {}
+        for options, papers in self.collect_concurrent(options_list, max_workers, incremental, force_full):
+            root = options['term']
+            self.logger.info(f"검색어 '{root}' 수집 완료: {len(papers)}개")
+            for paper in papers:
+                matched = [root] + self._match_terms(paper, plan[root][1:], same_as=root)
+                existing = papers_by_id.get(paper.get('id'))
+                if existing is None:
+                    paper['matched_terms'] = matched
+                    papers_by_id[paper.get('id')] = paper
+                else:
+                    existing['matched_terms'] = list(dict.fromkeys(existing['matched_terms'] + matched))
+        return list(papers_by_id.values())
+
+    def collect_concurrent(self, search_options_list: List[Dict[str, Any]], max_workers: int = None,
+                           incremental: bool = False, force_full: bool = False
+                           ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """여러 검색 옵션을 동시에 수집하고, 완료되는 순서대로 (검색 옵션, 논문 목록)을 반환합니다."""
+        if not search_options_list:
+            return
+        
+        workers = max(1, min(max_workers or self.max_workers, len(search_options_list)))
+        self.logger.info(f"{len(search_options_list)}개 검색을 {workers}개 워커로 동시 수집합니다.")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            if incremental:
+                futures = {
+                    executor.submit(self.collect_incremental, search_options, force_full): search_options
+                    for search_options in search_options_list
+                }
+            else:
+                futures = {
+                    executor.submit(self.collect, search_options): search_options
+                    for search_options in search_options_list
+                }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
 
     def direct_url_request(self, search_term: str) -> List[Dict[str, Any]]:
         """직접 URL 요청으로 논문 정보 가져오기"""
@@ -312,9 +887,10 @@ class ChemRxivCollector:
             self.logger.info(f"직접 URL 요청: {url}")
             
             # HTTP 요청
-            response = requests.get(
+            response = self._get_cached(
                 url,
-                headers=self.headers
+                headers=self.headers,
+                ttl=self.search_cache_ttl
             )
             
             if response.status_code != 200:
@@ -374,44 +950,45 @@ class ChemRxivCollector:
             self.logger.error(f"직접 URL 요청 중 오류 발생: {e}")
             return []
     
-    def download_and_extract_pdf(self, url: str) -> str:
-        try:
-            # PDF 다운로드
-            response = requests.get(url, headers=self.headers, stream=True)
-            response.raise_for_status()
-            
-            # PDF 텍스트 추출
-            with io.BytesIO(response.content) as pdf_file:
-                text = extract_text(pdf_file)
-                return text
-                
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"PDF 다운로드 중 네트워크 오류 발생: {e}")
+    def download_and_extract_pdf(self, url: str, max_pages: int = None, max_chars: int = None,
+                                 timeout: float = 120, memory_limit_mb: int = 2048) -> str:
+        """PDF를 받아 텍스트를 반환합니다. 실패하면 빈 문자열을 반환합니다.
+
+        download_pdf로 저장소에 받아 두므로 같은 URL은 다시 받지 않고, 추출은 extract_texts_from_pdfs와
+        같은 워커 프로세스에서 실행되어 같은 내용의 PDF는 다시 추출하지 않습니다.
+        """
+        name = urllib.parse.urlparse(url).path.rstrip('/').rsplit('/', 1)[-1] or 'document'
+        if not name.endswith('.pdf'):
+            name += '.pdf'
+        if not self.download_pdf(url, name):
             return ""
-        except PDFSyntaxError as e:
-            self.logger.error(f"PDF 파싱 오류 발생: {e}")
+        
+        pdf_path = self.get_pdf_path(name)
+        if pdf_path is None:
             return ""
-        except Exception as e:
-            self.logger.error(f"PDF 처리 중 오류 발생: {e}")
+        results = self.extract_texts_from_pdfs(
+            [pdf_path],
+            max_workers=1,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            max_pages=max_pages,
+            max_chars=max_chars
+        )
+        if not results.get(str(pdf_path)):
             return ""
+        return self.get_pdf_text(pdf_path, max_pages, max_chars) or ""
     
     def download_and_extract_html(self, url: str) -> str:
         try:
             # HTML 다운로드
-            response = requests.get(url, headers=self.headers)
+            response = self._get_cached(url, headers=self.headers)
             response.raise_for_status()
             
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 메인 콘텐츠 추출
-            main_content = soup.find('div', class_='main-content')
-            if not main_content:
+            # 메인 콘텐츠 텍스트 추출
+            text = extract_main_text(response.content, response.headers.get('Content-Type'))
+            if text is None:
                 self.logger.warning(f"HTML에서 메인 콘텐츠를 찾을 수 없음: {url}")
                 return ""
-            
-            # 텍스트 추출
-            text = main_content.get_text(separator=' ', strip=True)
             return text
             
         except requests.exceptions.RequestException as e:
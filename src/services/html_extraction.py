@@ -0,0 +1,138 @@
+import io
+import re
+import logging
+from typing import Optional, Callable
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+except ImportError:  # lxml이 없으면 BeautifulSoup 경로만 사용
+    etree = None
+
+# 로깅 설정
+logger = logging.getLogger('arxiv_collector')
+
+# 본문에서 제거할 요소
+REMOVED_TAGS = ('script', 'style', 'nav', 'header', 'footer')
+
+
+def _is_article(tag: str, attrib) -> bool:
+    return tag == 'article'
+
+
+def _is_main_content(tag: str, attrib) -> bool:
+    return tag == 'div' and 'main-content' in (attrib.get('class') or '').split()
+
+
+def _find_subtree(content: bytes, match: Callable, encoding: str = None):
+    """lxml iterparse로 처음 일치하는 요소의 하위 트리만 남기며 파싱합니다.
+
+    대상 요소 밖에서 끝난 요소는 바로 비워서 문서 전체 트리를 메모리에 유지하지 않고,
+    대상 요소가 끝나면 나머지 문서는 파싱하지 않습니다.
+    """
+    depth = 0
+    for event, element in etree.iterparse(io.BytesIO(content), events=('start', 'end'),
+                                          html=True, encoding=encoding, recover=True):
+        if not isinstance(element.tag, str):
+            continue
+        if event == 'start':
+            if depth or match(element.tag, element.attrib):
+                depth += 1
+        elif depth:
+            depth -= 1
+            if depth == 0:
+                return element
+        else:
+            # 대상 밖에서 끝난 요소: 앞선 형제 요소와 함께 정리
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+    return None
+
+
+def _drop(element):
+    """요소를 제거하되 뒤에 이어지는 텍스트(tail)는 남깁니다."""
+    parent = element.getparent()
+    if element.tail:
+        previous = element.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or '') + element.tail
+        else:
+            parent.text = (parent.text or '') + element.tail
+    parent.remove(element)
+
+
+def _strip_tags(element):
+    for removed in list(element.iter(*REMOVED_TAGS)):
+        if removed is not element:
+            _drop(removed)
+
+
+def _fix_image_urls(element, base_url: str):
+    for img in element.iter('img'):
+        if img.get('src', '').startswith('/'):
+            img.set('src', f"{base_url}{img.get('src')}")
+
+
+def _get_text(element) -> str:
+    return ' '.join(text.strip() for text in element.itertext() if text.strip())
+
+
+def _charset(content_type: str) -> Optional[str]:
+    """Content-Type 헤더에 명시된 문자 인코딩을 반환합니다."""
+    match = re.search(r'charset=["\']?([\w-]+)', content_type or '', re.IGNORECASE)
+    return match.group(1) if match else None
+
+
+def extract_article_html(content: bytes, content_type: str = None,
+                         base_url: str = 'https://chemrxiv.org') -> Optional[str]:
+    """HTML에서 <article> 본문을 정리된 HTML 문자열로 반환합니다. 없으면 None을 반환합니다.
+
+    lxml이 있으면 <article> 하위 트리만 파싱하고, 찾지 못하거나 실패하면 BeautifulSoup 전체 파싱으로 처리합니다.
+    """
+    if etree is not None:
+        try:
+            article = _find_subtree(content, _is_article, _charset(content_type))
+            if article is not None:
+                _strip_tags(article)
+                _fix_image_urls(article, base_url)
+                article.tail = None
+                return etree.tostring(article, method='html', encoding='unicode')
+        except (etree.LxmlError, ValueError) as e:
+            logger.debug(f"lxml 파싱 실패, BeautifulSoup으로 처리합니다: {e}")
+
+    soup = BeautifulSoup(content, 'html.parser', from_encoding=_charset(content_type))
+    for element in soup.find_all(list(REMOVED_TAGS)):
+        element.decompose()
+    main_content = soup.find('article')
+    if not main_content:
+        return None
+    for img in main_content.find_all('img'):
+        if img.get('src', '').startswith('/'):
+            img['src'] = f"{base_url}{img['src']}"
+    return str(main_content)
+
+
+def extract_main_text(content: bytes, content_type: str = None) -> Optional[str]:
+    """HTML의 div.main-content 텍스트를 반환합니다. 없으면 None을 반환합니다.
+
+    lxml이 있으면 대상 하위 트리만 파싱하고, 찾지 못하거나 실패하면 BeautifulSoup 전체 파싱으로 처리합니다.
+    """
+    if etree is not None:
+        try:
+            main_content = _find_subtree(content, _is_main_content, _charset(content_type))
+            if main_content is not None:
+                for removed in main_content.iter('script', 'style'):
+                    if removed is not main_content:
+                        removed.text = None
+                return _get_text(main_content)
+        except (etree.LxmlError, ValueError) as e:
+            logger.debug(f"lxml 파싱 실패, BeautifulSoup으로 처리합니다: {e}")
+
+    soup = BeautifulSoup(content, 'html.parser', from_encoding=_charset(content_type))
+    main_content = soup.find('div', class_='main-content')
+    if not main_content:
+        return None
+    return main_content.get_text(separator=' ', strip=True)
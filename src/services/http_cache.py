@@ -0,0 +1,176 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable
+import requests
+
+# 로깅 설정
+logger = logging.getLogger('arxiv_collector')
+
+class HTTPResponseCache:
+    """ETag/Last-Modified 검증자를 이용하는 디스크 기반 HTTP 응답 캐시입니다.
+
+    응답 본문과 메타데이터를 요청 URL(쿼리 포함)의 해시로 저장하고,
+    다음 요청 시 If-None-Match/If-Modified-Since를 보내 304 응답이면
+    저장된 본문을 그대로 사용합니다. ttl을 지정하면 그 시간 동안은
+    서버에 확인하지 않고 캐시를 바로 반환합니다.
+    """
+
+    # 캐시된 응답에 복원할 헤더
+    _KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Content-Encoding')
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _cache_key(self, url: str, params: Dict[str, Any] = None) -> str:
+        """URL과 쿼리 파라미터로 캐시 키를 생성합니다."""
+        prepared = requests.Request('GET', url, params=params).prepare()
+        return hashlib.sha256(prepared.url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str):
+        shard = self.cache_dir / key[:2]
+        return shard / f"{key}.json", shard / f"{key}.body"
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        meta_path, body_path = self._paths(key)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (IOError, json.JSONDecodeError) as e:
+            logger.error(f"HTTP 캐시 메타데이터 로드 중 오류 발생: {e}")
+            return None
+
+    def _write_atomic(self, path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 같은 프로세스의 여러 스레드가 같은 항목을 동시에 저장할 수 있으므로 스레드 ID도 포함
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _store(self, key: str, response: requests.Response):
+        meta_path, body_path = self._paths(key)
+        meta = {
+            'url': response.url,
+            'stored_at': time.time(),
+            'encoding': response.encoding,
+            'headers': {name: response.headers[name] for name in self._KEPT_HEADERS if name in response.headers}
+        }
+        try:
+            self._write_atomic(body_path, response.content)
+            self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        except IOError as e:
+            logger.error(f"HTTP 캐시 저장 중 오류 발생: {e}")
+
+    def _touch(self, key: str, meta: Dict[str, Any]):
+        meta_path, _ = self._paths(key)
+        meta['stored_at'] = time.time()
+        try:
+            self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        except IOError as e:
+            logger.error(f"HTTP 캐시 갱신 중 오류 발생: {e}")
+
+    def _build_response(self, key: str, meta: Dict[str, Any]) -> Optional[requests.Response]:
+        """저장된 본문으로 requests.Response 객체를 만듭니다."""
+        _, body_path = self._paths(key)
+        try:
+            with open(body_path, 'rb') as f:
+                content = f.read()
+        except IOError as e:
+            logger.error(f"HTTP 캐시 본문 로드 중 오류 발생: {e}")
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = meta.get('url', '')
+        response.encoding = meta.get('encoding')
+        response.headers.update(meta.get('headers', {}))
+        response.headers['X-Cache'] = 'HIT'
+        response._content = content
+        return response
+
+    def get(self, fetch: Callable[..., requests.Response], url: str, params: Dict[str, Any] = None,
+            headers: Dict[str, str] = None, ttl: float = None, **kwargs) -> requests.Response:
+        """캐시를 거쳐 GET 요청을 수행합니다. fetch는 실제 요청 함수(session.get 호환)입니다."""
+        key = self._cache_key(url, params)
+        meta = self._load(key)
+
+        # TTL 이내면 서버 확인 없이 반환
+        if meta and ttl is not None and time.time() - meta.get('stored_at', 0) < ttl:
+            cached = self._build_response(key, meta)
+            if cached is not None:
+                logger.debug(f"HTTP 캐시 적중 (TTL): {url}")
+                return cached
+
+        # 조건부 요청 헤더 추가
+        request_headers = dict(headers or {})
+        if meta:
+            cached_headers = meta.get('headers', {})
+            if cached_headers.get('ETag'):
+                request_headers['If-None-Match'] = cached_headers['ETag']
+            if cached_headers.get('Last-Modified'):
+                request_headers['If-Modified-Since'] = cached_headers['Last-Modified']
+
+        response = fetch(url, params=params, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and meta:
+            cached = self._build_response(key, meta)
+            if cached is not None:
+                logger.debug(f"HTTP 캐시 적중 (304): {url}")
+                self._touch(key, meta)
+                return cached
+
+        # 검증자가 있거나 TTL 캐시 대상인 성공 응답만 저장
+        if response.status_code == 200 and (
+            ttl is not None or 'ETag' in response.headers or 'Last-Modified' in response.headers
+        ):
+            self._store(key, response)
+
+        return response
+
+    def prune(self, max_age: float = None, max_bytes: int = None) -> int:
+        """max_age(초)보다 오래 갱신되지 않은 항목을 삭제하고, 남은 크기가 max_bytes를 넘으면
+        오래된 항목부터 삭제합니다. 삭제한 항목 수를 반환합니다."""
+        entries = []
+        for meta_path in self.cache_dir.glob('*/*.json'):
+            body_path = meta_path.with_suffix('.body')
+            try:
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    stored_at = json.load(f).get('stored_at', 0)
+            except (IOError, json.JSONDecodeError):
+                stored_at = 0  # 손상된 항목은 가장 오래된 것으로 취급
+            size = meta_path.stat().st_size + (body_path.stat().st_size if body_path.exists() else 0)
+            entries.append((stored_at, size, meta_path, body_path))
+        entries.sort()
+
+        now = time.time()
+        total = sum(size for _, size, _, _ in entries)
+        removed = 0
+        for stored_at, size, meta_path, body_path in entries:
+            expired = max_age is not None and now - stored_at > max_age
+            oversized = max_bytes is not None and total > max_bytes
+            if not expired and not oversized:
+                break
+            for path in (meta_path, body_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total -= size
+            removed += 1
+
+        # 저장 도중 중단되어 본문만 남은 항목 정리 (저장 중인 항목은 건너뜀)
+        for body_path in self.cache_dir.glob('*/*.body'):
+            if not body_path.with_suffix('.json').exists() and now - body_path.stat().st_mtime > 3600:
+                body_path.unlink()
+
+        if removed:
+            logger.info(f"HTTP 캐시 항목 {removed}개를 삭제했습니다.")
+        return removed
@@ -0,0 +1,155 @@
+import time
+import logging
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+from .rate_limiter import get_rate_limiter
+
+# 로깅 설정
+logger = logging.getLogger('paper_analyzer')
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD 방식으로 동시 요청 수를 조절합니다.
+
+    성공할 때마다 한도를 조금씩 늘리고(additive increase),
+    429/5xx 또는 타임아웃이 발생하면 한도를 절반으로 줄입니다(multiplicative decrease).
+    """
+
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """사용 가능한 슬롯이 생길 때까지 대기합니다."""
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, success: bool = True, overloaded: bool = False):
+        """슬롯을 반환하고 결과에 따라 한도를 조정합니다."""
+        with self._cond:
+            self.in_flight -= 1
+            if overloaded:
+                self.limit = max(float(self.min_limit), self.limit / 2)
+                logger.warning(f"API 과부하 감지, 동시 요청 한도를 {int(self.limit)}(으)로 줄입니다.")
+            elif success:
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+
+class DeepSeekClient:
+    """연결 풀과 적응형 동시성 제어를 사용하는 DeepSeek API 클라이언트입니다.
+
+    여러 스레드에서 동시에 chat()을 호출해도 안전합니다.
+    """
+
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    def __init__(self, api_key: str, api_url: str, max_in_flight: int = 8,
+                 timeout: Union[float, Tuple[float, float]] = (10, 120),
+                 max_retries: int = 3, backoff_base: float = 2.0,
+                 rate_limit: float = None, rate_burst: float = 1):
+        self.api_url = api_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.max_in_flight = max(1, max_in_flight)
+
+        # 연결 풀 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_in_flight)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # 동시성 제어
+        self.limiter = AdaptiveConcurrencyLimiter(self.max_in_flight)
+        
+        # 초당 요청 수 제한 (프로세스 전체 공유, API 호스트별 토큰 버킷)
+        self.rate_limiter = get_rate_limiter()
+        if rate_limit:
+            self.rate_limiter.configure(api_url, rate_limit, rate_burst)
+        self._pause_lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더를 초 단위로 변환합니다."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _pause(self, seconds: float):
+        """모든 요청을 지정된 시간 동안 보류합니다."""
+        with self._pause_lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _wait_if_paused(self):
+        """보류 중이면 해제될 때까지 대기합니다."""
+        with self._pause_lock:
+            delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def chat(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """chat completions 요청을 보내고 응답 JSON을 반환합니다."""
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            self._wait_if_paused()
+            self.rate_limiter.acquire(self.api_url)
+            self.limiter.acquire()
+            response = None
+            success = overloaded = False
+            try:
+                response = self.session.post(self.api_url, json=payload, timeout=self.timeout)
+                if response.status_code in self.RETRY_STATUS_CODES:
+                    overloaded = True
+                else:
+                    success = response.ok
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                overloaded = True
+                last_error = e
+            except requests.exceptions.RequestException as e:
+                # 응답 본문 수신 중 연결 끊김(ChunkedEncodingError) 등도 재시도
+                last_error = e
+            finally:
+                # 어떤 예외가 발생해도 슬롯은 반드시 반환
+                self.limiter.release(success=success, overloaded=overloaded)
+
+            if response is None:
+                delay = self.backoff_base ** attempt
+            elif response.status_code in self.RETRY_STATUS_CODES:
+                last_error = requests.exceptions.HTTPError(
+                    f"{response.status_code} Error: {response.reason}", response=response
+                )
+                retry_after = self._retry_after(response)
+                delay = retry_after if retry_after is not None else self.backoff_base ** attempt
+                if response.status_code == 429:
+                    self._pause(delay)
+            else:
+                response.raise_for_status()
+                return response.json()
+
+            if attempt < self.max_retries:
+                logger.warning(f"API 요청 실패, {delay:.1f}초 후 재시도합니다 (시도 {attempt + 1}/{self.max_retries + 1}): {last_error}")
+                time.sleep(delay)
+
+        raise last_error
@@ -0,0 +1,283 @@
+import re
+import zlib
+import time
+import sqlite3
+import logging
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+
+# 로깅 설정
+logger = logging.getLogger('arxiv_collector')
+
+class NearDuplicateDetector:
+    """MinHash/LSH로 제목+초록이 거의 같은 논문(버전, 교차 게시 등)을 찾아 하나로 합칩니다.
+
+    정규화한 제목+초록의 단어 shingle로 MinHash 서명을 만들고, 서명을 밴드로 나눈
+    버킷(LSH)으로 후보를 찾은 뒤 추정 Jaccard 유사도로 확인합니다.
+    서명과 버킷은 SQLite에 저장되어 이전 실행에서 본 논문과도 비교합니다.
+    """
+
+    _MERSENNE_PRIME = (1 << 61) - 1
+    _MAX_HASH = (1 << 32) - 1
+    _SEED = 1
+    # SQLite 바인딩 변수 개수 제한 대비
+    _BATCH_SIZE = 500
+
+    def __init__(self, db_path: Path, threshold: float = 0.8, num_perm: int = 128, bands: int = 16,
+                 shingle_size: int = 3):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        # 실행 간 서명 호환을 위해 고정된 시드로 해시 함수 계수 생성
+        generator = np.random.RandomState(self._SEED)
+        self._a = generator.randint(1, self._MAX_HASH, size=num_perm, dtype=np.uint64)
+        self._b = generator.randint(0, self._MAX_HASH, size=num_perm, dtype=np.uint64)
+
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._init_schema()
+
+    def _init_schema(self):
+        """테이블을 생성합니다. 서명 설정이 바뀌었으면 기존 서명을 삭제합니다."""
+        params = f"{self.num_perm}:{self.bands}:{self.shingle_size}:{self._SEED}"
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS signatures (
+                    paper_id TEXT PRIMARY KEY,
+                    signature BLOB NOT NULL,
+                    published_date TEXT,
+                    version INTEGER NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS buckets (
+                    band INTEGER NOT NULL,
+                    bucket BLOB NOT NULL,
+                    paper_id TEXT NOT NULL,
+                    PRIMARY KEY (band, bucket, paper_id)
+                )
+            """)
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+            if row and row[0] != params:
+                logger.info("MinHash 설정이 변경되어 저장된 서명을 초기화합니다.")
+                self._conn.execute("DELETE FROM signatures")
+                self._conn.execute("DELETE FROM buckets")
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('params', ?)", (params,))
+
+    def _shingles(self, paper: Dict[str, Any]) -> List[str]:
+        text = f"{paper.get('title', '')} {paper.get('abstract', '')}"
+        words = re.findall(r'\w+', unicodedata.normalize('NFKC', text).lower())
+        if len(words) < self.shingle_size:
+            return [' '.join(words)] if words else []
+        return [' '.join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)]
+
+    def signature(self, paper: Dict[str, Any]) -> Optional[np.ndarray]:
+        """논문의 MinHash 서명을 반환합니다. 텍스트가 없으면 None을 반환합니다."""
+        shingles = self._shingles(paper)
+        if not shingles:
+            return None
+        hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in set(shingles)), dtype=np.uint64)
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % self._MERSENNE_PRIME
+        return (permuted & self._MAX_HASH).min(axis=1).astype(np.uint32)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def similarity(self, first: np.ndarray, second: np.ndarray) -> float:
+        """두 서명의 추정 Jaccard 유사도를 반환합니다."""
+        return float(np.mean(first == second))
+
+    @staticmethod
+    def _version(paper: Dict[str, Any]) -> int:
+        try:
+            return int(paper.get('version') or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def _lookup_buckets(self, band_keys: Dict[str, List[bytes]]) -> Dict[Tuple[int, bytes], List[str]]:
+        """저장된 버킷에서 {(밴드, 버킷): 논문 ID 목록}을 조회합니다. 밴드마다 일괄 조회합니다."""
+        results = {}
+        for band in range(self.bands):
+            keys = list({keys[band] for keys in band_keys.values()})
+            for i in range(0, len(keys), self._BATCH_SIZE):
+                batch = keys[i:i + self._BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                with self._lock:
+                    rows = self._conn.execute(
+                        f"SELECT bucket, paper_id FROM buckets WHERE band = ? AND bucket IN ({placeholders})",
+                        (band, *batch)
+                    ).fetchall()
+                for bucket, paper_id in rows:
+                    results.setdefault((band, bucket), []).append(paper_id)
+        return results
+
+    def _load_signatures(self, paper_ids: List[str]) -> Dict[str, Tuple[np.ndarray, str, int]]:
+        """저장된 논문의 {ID: (서명, 게시일, 버전)}을 조회합니다."""
+        results = {}
+        for i in range(0, len(paper_ids), self._BATCH_SIZE):
+            batch = paper_ids[i:i + self._BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT paper_id, signature, published_date, version FROM signatures WHERE paper_id IN ({placeholders})",
+                    batch
+                ).fetchall()
+            for paper_id, signature, published_date, version in rows:
+                results[paper_id] = (np.frombuffer(signature, dtype=np.uint32), published_date or '', version)
+        return results
+
+    def _save(self, papers: Dict[str, Dict[str, Any]], signatures: Dict[str, np.ndarray],
+              band_keys: Dict[str, List[bytes]]):
+        now = time.time()
+        signature_rows = [
+            (paper_id, signatures[paper_id].tobytes(), papers[paper_id].get('published_date', ''),
+             self._version(papers[paper_id]), now)
+            for paper_id in signatures
+        ]
+        bucket_rows = [
+            (band, key, paper_id)
+            for paper_id, keys in band_keys.items()
+            for band, key in enumerate(keys)
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO signatures (paper_id, signature, published_date, version, created_at) VALUES (?, ?, ?, ?, ?)",
+                    signature_rows
+                )
+                self._conn.executemany("INSERT OR IGNORE INTO buckets (band, bucket, paper_id) VALUES (?, ?, ?)", bucket_rows)
+
+    def collapse(self, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """거의 같은 논문 묶음을 가장 최신 버전 하나로 합친 목록을 반환합니다.
+
+        남은 논문에는 합쳐진 논문 ID를 'duplicate_ids'로 기록합니다. 이전 실행에서 본 논문이
+        더 최신이면 이번 묶음의 논문은 모두 제외합니다. 모든 서명은 다음 실행을 위해 저장됩니다.
+        """
+        by_id = {}
+        for paper in papers:
+            if paper.get('id'):
+                by_id.setdefault(paper['id'], paper)
+
+        signatures = {}
+        for paper_id, paper in by_id.items():
+            signature = self.signature(paper)
+            if signature is not None:
+                signatures[paper_id] = signature
+        band_keys = {paper_id: self._band_keys(signature) for paper_id, signature in signatures.items()}
+
+        # LSH 후보: 이번 목록 안의 같은 버킷 + 저장된 버킷
+        buckets: Dict[Tuple[int, bytes], List[str]] = {}
+        for paper_id, keys in band_keys.items():
+            for band, key in enumerate(keys):
+                buckets.setdefault((band, key), []).append(paper_id)
+        stored_buckets = self._lookup_buckets(band_keys)
+        stored_ids = sorted({
+            paper_id for members in stored_buckets.values() for paper_id in members if paper_id not in by_id
+        })
+        stored = self._load_signatures(stored_ids)
+
+        # 유사도를 확인하며 union-find로 묶음 구성
+        parent = {}
+
+        def find(node: str) -> str:
+            parent.setdefault(node, node)
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        def signature_of(node: str) -> Optional[np.ndarray]:
+            return signatures[node] if node in signatures else stored.get(node, (None,))[0]
+
+        for paper_id, keys in band_keys.items():
+            candidates = set()
+            for band, key in enumerate(keys):
+                candidates.update(buckets.get((band, key), ()))
+                candidates.update(stored_buckets.get((band, key), ()))
+            candidates.discard(paper_id)
+            for candidate in candidates:
+                candidate_signature = signature_of(candidate)
+                if candidate_signature is None or find(candidate) == find(paper_id):
+                    continue
+                if self.similarity(signatures[paper_id], candidate_signature) >= self.threshold:
+                    parent[find(candidate)] = find(paper_id)
+
+        def recency(node: str) -> Tuple[str, int]:
+            if node in by_id:
+                return by_id[node].get('published_date', '') or '', self._version(by_id[node])
+            _, published_date, version = stored[node]
+            return published_date, version
+
+        clusters: Dict[str, List[str]] = {}
+        for node in list(parent):
+            clusters.setdefault(find(node), []).append(node)
+
+        dropped = set()
+        for members in clusters.values():
+            if len(members) < 2:
+                continue
+            latest = max(members, key=recency)
+            duplicates = [member for member in members if member != latest]
+            dropped.update(member for member in duplicates if member in by_id)
+            if latest in by_id:
+                by_id[latest]['duplicate_ids'] = sorted(duplicates)
+            logger.info(f"유사 논문 {len(members)}개를 최신 버전({latest})으로 합칩니다: {sorted(duplicates)}")
+
+        self._save(by_id, signatures, band_keys)
+
+        result = []
+        seen = set()
+        for paper in papers:
+            paper_id = paper.get('id')
+            if paper_id in dropped or (paper_id and paper_id in seen):
+                continue
+            seen.add(paper_id)
+            result.append(paper)
+        if dropped:
+            logger.info(f"유사 논문 {len(dropped)}개를 제외했습니다. ({len(papers)}개 → {len(result)}개)")
+        return result
+
+    def prune(self, max_age: float) -> int:
+        """게시일이 max_age초보다 오래된 논문의 서명과 버킷을 삭제하고 삭제한 논문 수를 반환합니다.
+
+        게시일이 없는 논문은 저장 시각(created_at)을 기준으로 합니다.
+        """
+        now = time.time()
+        cutoff = now - max_age
+        cutoff_date = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(cutoff))
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                deleted = self._conn.execute(
+                    """
+                    DELETE FROM signatures
+                    WHERE (published_date IS NOT NULL AND published_date != '' AND published_date < ?)
+                       OR ((published_date IS NULL OR published_date = '') AND created_at < ?)
+                    """,
+                    (cutoff_date, cutoff)
+                ).rowcount
+                if deleted:
+                    self._conn.execute("DELETE FROM buckets WHERE paper_id NOT IN (SELECT paper_id FROM signatures)")
+        if deleted:
+            logger.info(f"오래된 유사 논문 서명 {deleted}개를 삭제했습니다.")
+        return deleted
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
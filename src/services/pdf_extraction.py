@@ -0,0 +1,170 @@
+import re
+import signal
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Tuple, Iterator, Any, Union, BinaryIO
+from pdfminer.high_level import extract_text, extract_pages
+from pdfminer.layout import LTTextContainer
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import resolve1
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 로깅 설정
+logger = logging.getLogger('arxiv_collector')
+
+class ExtractionTimeout(Exception):
+    """문서 하나의 추출 시간이 제한을 넘었을 때 발생합니다."""
+
+
+def clean_text(text: str) -> str:
+    """연속된 공백을 하나로 합치고 앞뒤 공백을 제거합니다."""
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def iter_pdf_pages(pdf_file: Union[str, BinaryIO], max_pages: int = None) -> Iterator[str]:
+    """PDF의 페이지별 텍스트를 앞에서부터 하나씩 반환합니다. max_pages 이후 페이지는 파싱하지 않습니다."""
+    for page_layout in extract_pages(pdf_file, maxpages=max_pages or 0):
+        yield ''.join(element.get_text() for element in page_layout if isinstance(element, LTTextContainer))
+
+
+def count_pdf_pages(pdf_file: Union[str, BinaryIO]) -> int:
+    """페이지 내용을 파싱하지 않고 PDF의 전체 페이지 수를 반환합니다."""
+    def _count(fp) -> int:
+        document = PDFDocument(PDFParser(fp))
+        pages = resolve1(document.catalog.get('Pages'))
+        count = resolve1(pages.get('Count')) if isinstance(pages, dict) else None
+        if isinstance(count, int):
+            return count
+        return sum(1 for _ in PDFPage.create_pages(document))
+
+    if isinstance(pdf_file, (str, bytes)) or hasattr(pdf_file, '__fspath__'):
+        with open(pdf_file, 'rb') as fp:
+            return _count(fp)
+    pdf_file.seek(0)
+    return _count(pdf_file)
+
+
+def extract_pdf_excerpt(pdf_file: Union[str, BinaryIO], max_pages: int = None,
+                        max_chars: int = None) -> Dict[str, Any]:
+    """앞쪽 페이지부터 max_pages 또는 max_chars에 도달할 때까지만 텍스트를 추출합니다.
+
+    {'text': 추출 텍스트, 'pages_extracted': 파싱한 페이지 수, 'page_count': 전체 페이지 수}를 반환합니다.
+    """
+    pages = []
+    total_chars = 0
+    for page_text in iter_pdf_pages(pdf_file, max_pages):
+        page_text = clean_text(page_text)
+        pages.append(page_text)
+        total_chars += len(page_text) + 1
+        if max_chars and total_chars >= max_chars:
+            break
+
+    text = ' '.join(page for page in pages if page)
+    if max_chars:
+        text = text[:max_chars]
+
+    return {
+        'text': text,
+        'pages_extracted': len(pages),
+        'page_count': count_pdf_pages(pdf_file)
+    }
+
+
+def extract_pdf_text(pdf_file: Union[str, BinaryIO], max_pages: int = None, max_chars: int = None) -> str:
+    """PDF 텍스트를 추출하여 정리된 문자열로 반환합니다. 제한이 있으면 앞쪽 페이지만 파싱합니다."""
+    if max_pages or max_chars:
+        return extract_pdf_excerpt(pdf_file, max_pages, max_chars)['text']
+    return clean_text(extract_text(pdf_file))
+
+
+def _init_worker(memory_limit_mb: Optional[int]):
+    """워커 프로세스의 주소 공간 크기를 제한합니다."""
+    if not memory_limit_mb or resource is None:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    except (ValueError, OSError) as e:
+        logger.warning(f"PDF 추출 워커 메모리 제한 설정 실패: {e}")
+
+
+def _raise_timeout(signum, frame):
+    raise ExtractionTimeout()
+
+
+def _extract_job(pdf_path: str, output_path: str, timeout: Optional[float],
+                 max_pages: int = None, max_chars: int = None) -> Tuple[bool, Optional[str]]:
+    """워커 프로세스에서 PDF 하나를 추출해 저장합니다. (성공 여부, 오류 메시지)를 반환합니다."""
+    use_alarm = bool(timeout) and hasattr(signal, 'setitimer')
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        text = extract_pdf_text(pdf_path, max_pages, max_chars)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return True, None
+    except ExtractionTimeout:
+        return False, f"시간 초과 ({timeout}초)"
+    except MemoryError:
+        return False, "메모리 한도 초과"
+    except Exception as e:
+        return False, str(e)
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _run_pool(jobs: List[Tuple[str, str]], max_workers: int, timeout: Optional[float],
+              memory_limit_mb: Optional[int], max_pages: int = None,
+              max_chars: int = None) -> Tuple[Dict[str, Tuple[bool, Optional[str]]], List[Tuple[str, str]]]:
+    """작업을 프로세스 풀에서 실행합니다. 풀이 비정상 종료되어 끝나지 못한 작업은 따로 반환합니다."""
+    results = {}
+    broken = []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(memory_limit_mb,)) as executor:
+        futures = {
+            executor.submit(_extract_job, pdf_path, output_path, timeout, max_pages, max_chars): (pdf_path, output_path)
+            for pdf_path, output_path in jobs
+        }
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                results[job[0]] = future.result()
+            except BrokenProcessPool:
+                broken.append(job)
+    return results, broken
+
+
+def extract_pdfs_parallel(jobs: List[Tuple[str, str]], max_workers: int = None, timeout: float = 120,
+                          memory_limit_mb: int = 2048, max_pages: int = None,
+                          max_chars: int = None) -> Dict[str, Tuple[bool, Optional[str]]]:
+    """여러 PDF를 프로세스 풀에서 병렬로 추출합니다.
+
+    jobs는 (PDF 경로, 출력 텍스트 경로) 목록이며, {PDF 경로: (성공 여부, 오류 메시지)}를 반환합니다.
+    max_pages/max_chars를 지정하면 각 문서의 앞쪽 페이지만 추출합니다.
+    워커가 비정상 종료(세그폴트, OOM 강제 종료 등)하면 영향을 받은 문서만
+    단일 워커 풀에서 하나씩 다시 실행하여 원인 문서를 격리합니다.
+    """
+    if not jobs:
+        return {}
+
+    results, broken = _run_pool(jobs, max_workers, timeout, memory_limit_mb, max_pages, max_chars)
+
+    for job in broken:
+        retry_results, still_broken = _run_pool([job], 1, timeout, memory_limit_mb, max_pages, max_chars)
+        results.update(retry_results)
+        if still_broken:
+            results[job[0]] = (False, "추출 프로세스가 비정상 종료되었습니다.")
+
+    return results
@@ -0,0 +1,93 @@
+import time
+import logging
+import threading
+import urllib.parse
+from typing import Dict, Optional, Tuple
+
+# 로깅 설정
+logger = logging.getLogger('arxiv_collector')
+
+class TokenBucket:
+    """초당 rate개씩 토큰이 채워지고 최대 burst개까지 모이는 토큰 버킷입니다.
+
+    토큰이 부족하면 미리 예약(음수 잔량)한 뒤 필요한 시간만큼만 대기하므로,
+    여러 스레드가 동시에 요청해도 도착 순서대로 간격이 배분됩니다.
+    """
+
+    def __init__(self, rate: float, burst: float = 1):
+        self.rate = rate
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """토큰을 예약하고 사용 가능해질 때까지 남은 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 얻을 때까지 대기하고 대기한 시간(초)을 반환합니다."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷을 관리하는 속도 제한기입니다.
+
+    configure()로 등록한 호스트는 등록된 (rate, burst)를 사용하고,
+    등록되지 않은 호스트는 acquire() 호출 시 전달한 값을 사용합니다.
+    rate가 없거나 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self):
+        self._limits: Dict[str, Tuple[float, float]] = {}
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url: str) -> str:
+        return urllib.parse.urlparse(url).netloc if '://' in url else url
+
+    def configure(self, host: str, rate: float, burst: float = 1):
+        """호스트의 초당 요청 수와 최대 연속 요청 수를 설정합니다.
+
+        설정이 바뀐 경우에만 버킷을 새로 만들므로, 같은 값으로 여러 번 호출해도 남은 토큰이 유지됩니다.
+        """
+        host = self._host(host)
+        with self._lock:
+            if self._limits.get(host) == (rate, burst):
+                return
+            self._limits[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def _bucket(self, host: str, rate: float = None, burst: float = 1) -> Optional[TokenBucket]:
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self._limits.get(host, (rate, burst))
+                self._buckets[host] = TokenBucket(rate, burst) if rate and rate > 0 else None
+            return self._buckets[host]
+
+    def acquire(self, url: str, rate: float = None, burst: float = 1, tokens: float = 1.0) -> float:
+        """URL(또는 호스트)의 버킷에서 토큰을 얻을 때까지 대기하고 대기한 시간(초)을 반환합니다."""
+        host = self._host(url)
+        bucket = self._bucket(host, rate, burst)
+        if bucket is None:
+            return 0.0
+        delay = bucket.acquire(tokens)
+        if delay > 0:
+            logger.debug(f"{host} 속도 제한으로 {delay:.2f}초 대기했습니다.")
+        return delay
+
+
+_shared_limiter = HostRateLimiter()
+
+def get_rate_limiter() -> HostRateLimiter:
+    """프로세스 전체에서 공유되는 호스트별 속도 제한기를 반환합니다."""
+    return _shared_limiter
@@ -0,0 +1,111 @@
+import re
+import math
+import threading
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Dict, Any, List, Iterable
+import numpy as np
+
+class BM25Index:
+    """논문 제목/초록/키워드에 대한 증분형 BM25 역색인입니다.
+
+    논문이 들어오는 대로 add()로 색인하며, 필드별 가중치를 적용한 단어 빈도로
+    BM25 점수를 계산합니다. 같은 키(논문 ID)는 한 번만 색인합니다.
+    """
+
+    FIELD_WEIGHTS = {'title': 2.0, 'keywords': 1.5, 'abstract': 1.0}
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, field_weights: Dict[str, float] = None,
+                 min_idf: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        # 검색 결과로만 색인이 구성되면 핵심 검색어(co2 등)의 idf가 0에 가까워지므로 하한을 둠
+        self.min_idf = min_idf
+        self.field_weights = field_weights or self.FIELD_WEIGHTS
+        self.postings: Dict[str, Dict[str, float]] = defaultdict(dict)  # 단어 → {문서 키: 가중 빈도}
+        self.doc_lengths: Dict[str, float] = {}
+        self.total_length = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """유니코드 정규화(CO₂ → co2) 후 영숫자 단어로 분리합니다."""
+        return re.findall(r'[a-z0-9]+', unicodedata.normalize('NFKC', text or '').lower())
+
+    @staticmethod
+    def doc_key(paper: Dict[str, Any]) -> str:
+        return str(paper.get('id') or paper.get('title', ''))
+
+    def _field_text(self, paper: Dict[str, Any], field: str) -> str:
+        value = paper.get(field, '')
+        return ' '.join(value) if isinstance(value, list) else str(value or '')
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.doc_lengths
+
+    def add(self, paper: Dict[str, Any]) -> str:
+        """논문을 색인하고 문서 키를 반환합니다. 이미 색인된 논문은 건너뜁니다."""
+        key = self.doc_key(paper)
+        if key in self.doc_lengths:
+            return key
+
+        frequencies = Counter()
+        for field, weight in self.field_weights.items():
+            for token in self.tokenize(self._field_text(paper, field)):
+                frequencies[token] += weight
+
+        with self._lock:
+            if key in self.doc_lengths:
+                return key
+            for token, frequency in frequencies.items():
+                self.postings[token][key] = frequency
+            length = sum(frequencies.values())
+            self.doc_lengths[key] = length
+            self.total_length += length
+        return key
+
+    def add_many(self, papers: Iterable[Dict[str, Any]]) -> List[str]:
+        """여러 논문을 색인하고 문서 키 목록을 반환합니다."""
+        return [self.add(paper) for paper in papers]
+
+    def idf(self, token: str) -> float:
+        """BM25 역문서 빈도를 반환합니다. min_idf보다 작아지지 않습니다."""
+        n = len(self.doc_lengths)
+        df = len(self.postings.get(token, ()))
+        return max(self.min_idf, math.log(1 + (n - df + 0.5) / (df + 0.5)))
+
+    def max_score(self, query_tokens: Iterable[str]) -> float:
+        """단어 빈도가 무한히 클 때의 점수 상한을 반환합니다. 점수 정규화에 사용합니다."""
+        return sum(self.idf(token) * (self.k1 + 1) for token in set(query_tokens))
+
+    def score_many(self, keys: List[str], query_tokens: Iterable[str]) -> np.ndarray:
+        """문서 키 목록의 BM25 점수를 입력 순서대로 반환합니다. 색인되지 않은 문서는 0점입니다."""
+        scores = np.zeros(len(keys))
+        if not self.doc_lengths:
+            return scores
+
+        positions = defaultdict(list)
+        for i, key in enumerate(keys):
+            positions[key].append(i)
+        avg_length = self.total_length / len(self.doc_lengths) or 1.0
+
+        # 단어 단위로 게시 목록을 한 번씩만 순회
+        for token in set(query_tokens):
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = self.idf(token)
+            # 게시 목록과 대상 문서 중 작은 쪽을 순회
+            if len(posting) <= len(positions):
+                matches = ((key, frequency) for key, frequency in posting.items() if key in positions)
+            else:
+                matches = ((key, posting[key]) for key in positions if key in posting)
+            for key, frequency in matches:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[key] / avg_length)
+                value = idf * frequency * (self.k1 + 1) / (frequency + norm)
+                for i in positions[key]:
+                    scores[i] += value
+        return scores
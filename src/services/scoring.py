@@ -0,0 +1,242 @@
+import heapq
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Dict, Any, List, Iterable, Tuple
+import numpy as np
+import pandas as pd
+
+# 특성 추출 함수: (논문 목록, 공유 컨텍스트) → 논문별 값 배열
+FeatureExtractor = Callable[[List[Dict[str, Any]], Dict[str, Any]], np.ndarray]
+
+FEATURES: Dict[str, FeatureExtractor] = {}
+
+
+@dataclass
+class ScoringComponent:
+    """특성 테이블의 열(features)만 읽어 논문별 점수(0~2점)를 계산하는 점수 항목입니다."""
+    name: str
+    features: Tuple[str, ...]
+    compute: Callable[[pd.DataFrame], np.ndarray]
+    description: str = ''
+
+
+COMPONENTS: Dict[str, ScoringComponent] = {}
+
+
+def register_feature(name: str):
+    """특성 추출 함수를 등록하는 데코레이터입니다."""
+    def decorator(func: FeatureExtractor) -> FeatureExtractor:
+        FEATURES[name] = func
+        return func
+    return decorator
+
+
+def register_component(name: str, features: Iterable[str], description: str = ''):
+    """점수 항목을 등록하는 데코레이터입니다. features는 계산에 필요한 특성 이름입니다."""
+    def decorator(func: Callable[[pd.DataFrame], np.ndarray]):
+        COMPONENTS[name] = ScoringComponent(name, tuple(features), func, description)
+        return func
+    return decorator
+
+
+def to_record(paper: Any) -> Dict[str, Any]:
+    """ChemRxiv 논문 딕셔너리는 그대로, arXiv 검색 결과 객체는 같은 키의 딕셔너리로 변환합니다."""
+    if isinstance(paper, dict):
+        return paper
+    return {
+        'id': getattr(paper, 'entry_id', ''),
+        'title': getattr(paper, 'title', ''),
+        'abstract': getattr(paper, 'summary', ''),
+        'authors': [getattr(author, 'name', str(author)) for author in getattr(paper, 'authors', [])],
+        'categories': list(getattr(paper, 'categories', [])),
+        'keywords': [],
+        'submission_date': getattr(paper, 'published', None)
+    }
+
+
+def build_feature_table(papers: List[Dict[str, Any]], names: Iterable[str],
+                        context: Dict[str, Any] = None) -> pd.DataFrame:
+    """필요한 특성만 논문 목록 전체에 대해 한 번씩 추출해 특성 테이블을 만듭니다."""
+    context = context or {}
+    return pd.DataFrame(
+        {name: FEATURES[name](papers, context) for name in dict.fromkeys(names)},
+        index=range(len(papers))
+    )
+
+
+def top_k(items: Iterable[Any], k: int, score_batch: Callable[[List[Any]], Iterable[float]],
+          chunk_size: int = 1000) -> List[Tuple[float, Any]]:
+    """항목을 chunk_size개씩 읽어 score_batch로 점수를 매기고, 상위 k개를 (점수, 항목) 목록으로 반환합니다.
+
+    크기 k의 최소 힙만 유지하므로 입력 전체를 목록으로 만들거나 정렬하지 않습니다.
+    결과는 점수 내림차순 안정 정렬의 앞 k개와 같습니다 (점수가 같으면 먼저 들어온 항목이 앞).
+    """
+    if k <= 0:
+        return []
+
+    # 힙 항목: (점수, -입력 순서, 항목) — 가장 약한 후보(낮은 점수, 늦은 순서)가 맨 앞
+    heap = []
+    index = 0
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        for score, item in zip(score_batch(chunk), chunk):
+            entry = (float(score), -index, item)
+            index += 1
+            if len(heap) < k:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+
+    return [(score, item) for score, _, item in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+
+
+# ---- 특성 ----
+
+def _count_items(value) -> int:
+    """리스트는 항목 수, 문자열은 쉼표로 구분된 항목 수를 반환합니다."""
+    if isinstance(value, list):
+        return len(value)
+    return len(value.split(',')) if isinstance(value, str) else 0
+
+
+def _text(value) -> str:
+    return value if isinstance(value, str) else ''
+
+
+@register_feature('author_count')
+def _author_count(papers, context):
+    return np.fromiter((_count_items(p.get('authors', [])) for p in papers), dtype=float, count=len(papers))
+
+
+@register_feature('category_count')
+def _category_count(papers, context):
+    return np.fromiter((_count_items(p.get('categories', [])) for p in papers), dtype=float, count=len(papers))
+
+
+@register_feature('keyword_count')
+def _keyword_count(papers, context):
+    return np.fromiter((_count_items(p.get('keywords', [])) for p in papers), dtype=float, count=len(papers))
+
+
+@register_feature('abstract_words')
+def _abstract_words(papers, context):
+    return np.fromiter((len(_text(p.get('abstract')).split()) for p in papers), dtype=float, count=len(papers))
+
+
+@register_feature('title_words')
+def _title_words(papers, context):
+    return np.fromiter((len(_text(p.get('title')).split()) for p in papers), dtype=float, count=len(papers))
+
+
+@register_feature('title_capitalized')
+def _title_capitalized(papers, context):
+    return np.fromiter(
+        (any(word[0].isupper() for word in _text(p.get('title')).split()) for p in papers),
+        dtype=bool, count=len(papers)
+    )
+
+
+@register_feature('days_since_submission')
+def _days_since_submission(papers, context):
+    """제출 후 경과 일수입니다. 날짜가 없거나 해석할 수 없으면 NaN입니다. 시간대가 없으면 UTC로 간주합니다."""
+    dates = pd.to_datetime(
+        pd.Series([p.get('submission_date') or None for p in papers], dtype=object),
+        utc=True, errors='coerce', format='ISO8601'
+    )
+    return ((pd.Timestamp.now(tz='UTC') - dates) // pd.Timedelta(days=1)).to_numpy(dtype=float, na_value=np.nan)
+
+
+METHOD_KEYWORDS = ['method', 'approach', 'algorithm', 'technique', 'framework', 'model', 'architecture']
+EVAL_KEYWORDS = ['experiment', 'evaluation', 'result', 'performance', 'benchmark', 'comparison']
+
+
+def _keyword_hits(papers, keywords) -> np.ndarray:
+    return np.fromiter(
+        (sum(1 for keyword in keywords if keyword in _text(p.get('abstract')).lower()) for p in papers),
+        dtype=float, count=len(papers)
+    )
+
+
+@register_feature('method_mentions')
+def _method_mentions(papers, context):
+    return _keyword_hits(papers, METHOD_KEYWORDS)
+
+
+@register_feature('eval_mentions')
+def _eval_mentions(papers, context):
+    return _keyword_hits(papers, EVAL_KEYWORDS)
+
+
+@register_feature('relevance')
+def _relevance(papers, context):
+    """가장 잘 맞는 검색어 기준 관련성(0~1)입니다.
+
+    검색어마다 BM25 점수를 그 검색어의 점수 상한으로 나누고 최댓값을 사용합니다.
+    모든 검색어 단어를 합친 상한으로 나누면 한 주제에 집중한 논문도 낮은 값을 받습니다.
+    색인에 없는 논문은 먼저 색인합니다.
+    """
+    index = context['relevance_index']
+    keys = index.add_many(papers)
+    relevance = np.zeros(len(papers))
+    for tokens in context['query_terms']:
+        max_score = index.max_score(tokens)
+        if max_score:
+            relevance = np.maximum(relevance, index.score_many(keys, tokens) / max_score)
+    return relevance
+
+
+# ---- 점수 항목 ----
+
+@register_component('author', ['author_count'], '저자 수')
+def _author_score(table):
+    return np.minimum(table['author_count'].to_numpy() * 0.2, 2.0)
+
+
+@register_component('category', ['category_count'], '카테고리 수')
+def _category_score(table):
+    return np.minimum(table['category_count'].to_numpy() * 0.4, 2.0)
+
+
+@register_component('keyword', ['keyword_count'], '키워드 수')
+def _keyword_score(table):
+    return np.minimum(table['keyword_count'].to_numpy() * 0.2, 2.0)
+
+
+@register_component('abstract', ['abstract_words'], '초록 길이')
+def _abstract_score(table):
+    return np.minimum(table['abstract_words'].to_numpy() * 0.01, 2.0)
+
+
+@register_component('time', ['days_since_submission'], '최신성')
+def _time_score(table):
+    return np.nan_to_num(np.maximum(2.0 - table['days_since_submission'].to_numpy() * 0.01, 0.0), nan=0.0)
+
+
+@register_component('relevance', ['relevance'], '검색어 주제 관련성 (BM25)')
+def _relevance_score(table):
+    return 2.0 * table['relevance'].to_numpy()
+
+
+@register_component('title_quality', ['title_words', 'title_capitalized', 'abstract_words', 'category_count'],
+                    '제목 길이/표기, 초록 길이, 카테고리 다양성')
+def _title_quality_score(table):
+    title_words = table['title_words'].to_numpy()
+    abstract_words = table['abstract_words'].to_numpy()
+    category_count = table['category_count'].to_numpy()
+    return (
+        np.select([(title_words >= 5) & (title_words <= 10), (title_words >= 11) & (title_words <= 15)], [0.8, 0.6], 0.4)
+        + np.where(table['title_capitalized'].to_numpy(), 0.2, 0.0)
+        + np.select([abstract_words >= 200, abstract_words >= 100], [0.8, 0.6], 0.4)
+        + np.select([category_count >= 3, category_count == 2], [0.5, 0.3], 0.1)
+    )
+
+
+@register_component('content', ['method_mentions', 'eval_mentions'], '방법론/실험 언급')
+def _content_score(table):
+    return (
+        np.minimum(table['method_mentions'].to_numpy() * 0.2, 0.6)
+        + np.minimum(table['eval_mentions'].to_numpy() * 0.2, 0.4)
+    )
@@ -1,6 +1,5 @@
 import logging
 import os
-import time
 import requests
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
@@ -12,13 +11,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import pandas as pd
 from ..models.news import News
+from .rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
 class SeleniumBaseCollector:
-    def __init__(self, url: str):
+    def __init__(self, url: str, rate_limit: float = 1.0):
         self.url = url
         self.driver = None
+        self.rate_limit = rate_limit  # 호스트별 초당 최대 요청 수
+        self.rate_limiter = get_rate_limiter()
         self.download_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'data', 'papers')
         os.makedirs(self.download_dir, exist_ok=True)
 
@@ -37,6 +39,11 @@ class SeleniumBaseCollector:
         })
         self.driver = webdriver.Chrome(options=chrome_options)
 
+    def load_page(self, url: str):
+        """호스트별 속도 제한을 거쳐 브라우저로 페이지를 엽니다."""
+        self.rate_limiter.acquire(url, self.rate_limit)
+        self.driver.get(url)
+
     def wait_for_element(self, by: By, value: str, timeout: int = 10):
         return WebDriverWait(self.driver, timeout).until(
                 EC.presence_of_element_located((by, value))
@@ -56,6 +63,7 @@ class SeleniumBaseCollector:
 
     def download_pdf(self, url: str, filename: str) -> bool:
         try:
+            self.rate_limiter.acquire(url, self.rate_limit)
             response = requests.get(url, stream=True)
             response.raise_for_status()
             
@@ -86,7 +94,7 @@ class ArxivCSCollector(SeleniumBaseCollector):
         """논문 링크 수집"""
         try:
             self.setup_driver()
-            self.driver.get(self.url)
+            self.load_page(self.url)
             
             # 페이지 로딩 대기
             self.wait_for_element(By.CSS_SELECTOR, "dt")
@@ -109,7 +117,7 @@ class ArxivCSCollector(SeleniumBaseCollector):
                 # 다음 페이지로 이동
                 if len(paper_links) < self.max_papers:
                     skip += 25
-                    self.driver.get(f"{self.url}?skip={skip}")
+                    self.load_page(f"{self.url}?skip={skip}")
                     self.wait_for_element(By.CSS_SELECTOR, "dt")
             
             return paper_links[:self.max_papers]
@@ -124,7 +132,7 @@ class ArxivCSCollector(SeleniumBaseCollector):
         """개별 논문 상세 정보 수집"""
         try:
             self.setup_driver()
-            self.driver.get(url)
+            self.load_page(url)
             
             # 페이지 로딩 대기
             self.wait_for_element(By.CSS_SELECTOR, "h1.title")
@@ -219,7 +227,6 @@ class ArxivCSCollector(SeleniumBaseCollector):
                     continue
                 
                 papers.append(details)
-                time.sleep(1)  # 서버 부하 방지
             
             return papers
             
@@ -28,9 +28,7 @@ def main():
     df.to_csv(output_path, index=False, encoding='utf-8')
     print(f"수집된 논문 정보가 {output_path}에 저장되었습니다.")
     print(f"총 {len(papers)}개의 논문이 수집되었습니다.")
-    print(f"PDF 파일은 {crawler.papers_dir}에 저장되었습니다.")
-    print(f"HTML 파일은 {crawler.html_dir}에 저장되었습니다.")
-    print(f"텍스트 파일은 {crawler.text_dir}에 저장되었습니다.")
+    print(f"PDF/HTML/텍스트 파일은 {crawler.artifacts_dir}에 저장되었습니다.")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,33 @@
+import tempfile
+import unittest
+from pathlib import Path
+from src.services.analysis_cache import AnalysisCacheStore, LRUCache, TieredAnalysisCache
+
+class TestTieredAnalysisCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        store = AnalysisCacheStore(Path(self.tmp_dir.name) / 'analysis_cache.db')
+        self.addCleanup(store.close)
+        self.cache = TieredAnalysisCache(store, LRUCache())
+
+    def test_results_do_not_share_memory_entry(self):
+        data = {'title': 'paper', 'analysis': {'field': 'catalysis', 'tags': ['CO2']}}
+        self.cache.set('k', data)
+        data['analysis']['field'] = 'changed after set'
+
+        first = self.cache.get('k')
+        first['analysis']['tags'].append('mutated')
+        first['title'] = 'mutated'
+
+        second = self.cache.get('k')
+        self.assertEqual(second, {'title': 'paper', 'analysis': {'field': 'catalysis', 'tags': ['CO2']}})
+        self.assertEqual(self.cache.stats()['hits'], 2)
+
+    def test_store_results_do_not_share_memory_entry(self):
+        self.cache.store.set('k', {'analysis': {'field': 'catalysis'}})
+        self.cache.get('k')['analysis']['field'] = 'mutated'
+        self.assertEqual(self.cache.get('k'), {'analysis': {'field': 'catalysis'}})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import requests
+from requests.structures import CaseInsensitiveDict
+from src.services.arxiv_collector import ChemRxivCollector
+from src.services.artifact_store import ArtifactStore
+
+def make_item(paper_id, published_date):
+    return {'item': {'id': paper_id, 'title': f'Paper {paper_id}', 'publishedDate': published_date}}
+
+def make_page(items, total_count):
+    return {'itemHits': items, 'totalCount': total_count}
+
+class FakeResponse:
+    def __init__(self, status_code, headers, body, fail_after=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+        self.fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} Error")
+
+    def iter_content(self, chunk_size=1):
+        for i in range(0, len(self.body), 16):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise requests.exceptions.ChunkedEncodingError('connection dropped')
+            yield self.body[i:i + 16]
+
+class FakeFileServer:
+    """Range/If-Range를 처리하고, 지정한 요청에서 본문 전송 중 연결이 끊기는 서버입니다."""
+
+    def __init__(self, body, etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+        self.failures = {}  # 요청 순번 → 끊기는 위치 (bytes)
+
+    def get(self, url, headers=None, retries=None, **kwargs):
+        headers = headers or {}
+        self.retries = retries
+        self.requests.append(headers)
+        fail_after = self.failures.get(len(self.requests))
+        if 'Range' in headers and headers.get('If-Range') == self.etag:
+            start = int(headers['Range'][len('bytes='):-1])
+            body = self.body[start:]
+            return FakeResponse(206, {
+                'ETag': self.etag, 'Content-Length': str(len(body)),
+                'Content-Range': f"bytes {start}-{len(self.body) - 1}/{len(self.body)}"
+            }, body, fail_after)
+        return FakeResponse(200, {'ETag': self.etag, 'Content-Length': str(len(self.body))}, self.body, fail_after)
+
+class TestChemRxivCollector(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        root = Path(self.tmp_dir.name)
+        self.collector = ChemRxivCollector(use_http_cache=False, show_progress=False)
+        self.collector.artifacts = ArtifactStore(root / 'artifacts')
+        self.collector.watermark_path = root / 'search_watermarks.json'
+        self.collector._watermarks = {}
+        self.options = {'term': '"CO2 reduction"', 'limit': 2, 'sort': 'PUBLISHED_DATE_DESC'}
+
+    def test_incremental_updates_watermark(self):
+        pages = [
+            make_page([make_item('p3', '2026-10-03T00:00:00Z'), make_item('p2', '2026-10-02T00:00:00Z')], 3),
+            make_page([make_item('p1', '2026-10-01T00:00:00Z')], 3)
+        ]
+        with mock.patch.object(self.collector, '_request_page', side_effect=pages):
+            papers = self.collector.collect_incremental(self.options)
+        self.assertEqual([paper['id'] for paper in papers], ['p3', 'p2', 'p1'])
+        self.collector.commit_watermarks()
+        self.assertEqual(self.collector._watermarks['"CO2 reduction"']['ids'], ['p3'])
+        self.assertTrue(self.collector.watermark_path.exists())
+
+    def test_failed_page_keeps_watermark(self):
+        pages = [
+            make_page([make_item('p3', '2026-10-03T00:00:00Z'), make_item('p2', '2026-10-02T00:00:00Z')], 3),
+            None
+        ]
+        with mock.patch.object(self.collector, '_request_page', side_effect=pages):
+            papers = self.collector.collect_incremental(self.options)
+        # 받은 페이지의 논문은 반환하지만 워터마크는 갱신하지 않음
+        self.assertEqual([paper['id'] for paper in papers], ['p3', 'p2'])
+        self.collector.commit_watermarks()
+        self.assertEqual(self.collector._watermarks, {})
+        self.assertFalse(self.collector.watermark_path.exists())
+
+    def test_search_dates_are_day_aligned(self):
+        morning = self.collector._day_aligned_params({
+            'term': 'x', 'searchDateFrom': '2026-09-17T03:00:05Z', 'searchDateTo': '2026-10-17T03:00:05Z'
+        })
+        evening = self.collector._day_aligned_params({
+            'term': 'x', 'searchDateFrom': '2026-09-17T21:12:40Z', 'searchDateTo': '2026-10-17T21:12:40Z'
+        })
+        self.assertEqual(morning, evening)
+        self.assertEqual(morning['searchDateFrom'], '2026-09-17T00:00:00Z')
+        self.assertEqual(morning['searchDateTo'], '2026-10-18T00:00:00Z')
+
+    def test_search_filters_exact_date_from(self):
+        options = dict(self.options, searchDateFrom='2026-10-02T12:00:00Z')
+        page = make_page([make_item('p3', '2026-10-03T00:00:00Z'), make_item('p2', '2026-10-02T06:00:00Z')], 2)
+        with mock.patch.object(self.collector, '_request_page', return_value=page) as request_page:
+            papers = self.collector.collect(options)
+        self.assertEqual([paper['id'] for paper in papers], ['p3'])
+        self.assertEqual(request_page.call_args[0][0]['searchDateFrom'], '2026-10-02T12:00:00Z')
+
+    def test_plan_queries_keeps_unquoted_and_duplicate_terms(self):
+        terms = ['"CO2 reduction"', 'CO2 reduction', '"CO2 reduction Cu"', '"CO2  Reduction"', 'co2 reduction']
+        plan = self.collector.plan_queries(terms)
+        self.assertEqual(set(plan), {'"CO2 reduction"', 'CO2 reduction'})
+        self.assertEqual(plan['"CO2 reduction"'], ['"CO2 reduction"', '"CO2 reduction Cu"', '"CO2  Reduction"'])
+        self.assertEqual(plan['CO2 reduction'], ['CO2 reduction', 'co2 reduction'])
+
+    def test_collect_terms_records_duplicate_terms(self):
+        paper = {'id': 'p1', 'title': 'Reduction of CO2 on copper', 'abstract': '', 'keywords': []}
+        with mock.patch.object(self.collector, 'collect', side_effect=lambda options: [dict(paper)]):
+            papers = self.collector.collect_terms(['CO2 reduction', 'co2  reduction'], {}, max_workers=1)
+        self.assertEqual(len(papers), 1)
+        self.assertEqual(papers[0]['matched_terms'], ['CO2 reduction', 'co2  reduction'])
+
+    def test_retries_take_rate_limit_tokens(self):
+        responses = [FakeResponse(429, {'Retry-After': '7'}, b''), FakeResponse(503, {}, b''), FakeResponse(200, {}, b'ok')]
+        with mock.patch.object(self.collector.session, 'get', side_effect=responses) as get, \
+                mock.patch.object(self.collector.rate_limiter, 'acquire') as acquire, \
+                mock.patch('src.services.arxiv_collector.time.sleep') as sleep:
+            response = self.collector._get('http://api.test/items')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get.call_count, 3)
+        # 재시도 요청마다 토큰을 받음
+        self.assertEqual(acquire.call_count, 3)
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [7.0, self.collector.retry_delay * 2])
+
+    def test_download_retries_only_in_download_loop(self):
+        responses = [FakeResponse(503, {}, b'') for _ in range(10)]
+        with mock.patch.object(self.collector.session, 'get', side_effect=responses) as get, \
+                mock.patch('src.services.arxiv_collector.time.sleep'):
+            self.assertFalse(self.collector.download_pdf('http://files.test/a.pdf', 'a.pdf'))
+        self.assertEqual(get.call_count, self.collector.max_retries + 1)
+
+    def stored_pdf(self, name):
+        with open(self.collector.get_pdf_path(name), 'rb') as f:
+            return f.read()
+
+    def test_download_resumes_after_interruption(self):
+        server = FakeFileServer(bytes(range(256)) * 4)
+        server.failures = {1: 320}
+        with mock.patch.object(self.collector, '_get', side_effect=server.get), \
+                mock.patch('src.services.arxiv_collector.time.sleep'):
+            self.assertTrue(self.collector.download_pdf('http://files.test/a.pdf', 'a.pdf'))
+        self.assertEqual(server.requests[1], {'Range': 'bytes=320-', 'If-Range': '"v1"'})
+        self.assertEqual(server.retries, 0)
+        self.assertEqual(self.stored_pdf('a.pdf'), server.body)
+
+    def test_download_resumes_in_next_run(self):
+        server = FakeFileServer(bytes(range(256)) * 4)
+        server.failures = {1: 512}
+        self.collector.max_retries = 0
+        with mock.patch.object(self.collector, '_get', side_effect=server.get):
+            self.assertFalse(self.collector.download_pdf('http://files.test/a.pdf', 'a.pdf'))
+            self.assertTrue(self.collector.download_pdf('http://files.test/a.pdf', 'a.pdf'))
+        self.assertEqual(server.requests[1]['Range'], 'bytes=512-')
+        self.assertEqual(self.stored_pdf('a.pdf'), server.body)
+
+    def test_download_restarts_when_file_changed(self):
+        server = FakeFileServer(b'a' * 1000)
+        server.failures = {1: 480}
+        self.collector.max_retries = 0
+        with mock.patch.object(self.collector, '_get', side_effect=server.get):
+            self.assertFalse(self.collector.download_pdf('http://files.test/a.pdf', 'a.pdf'))
+            server.body, server.etag = b'b' * 900, '"v2"'
+            self.assertTrue(self.collector.download_pdf('http://files.test/a.pdf', 'a.pdf'))
+        self.assertEqual(server.requests[1]['If-Range'], '"v1"')
+        self.assertEqual(self.stored_pdf('a.pdf'), b'b' * 900)
+
+    def test_download_and_extract_pdf_reuses_store(self):
+        server = FakeFileServer(b'%PDF-1.4 fake')
+
+        def fake_extract(jobs, **kwargs):
+            pdf_path, output_path = jobs[0]
+            Path(output_path).write_text('extracted text', encoding='utf-8')
+            return {pdf_path: (True, None)}
+
+        with mock.patch.object(self.collector, '_get', side_effect=server.get), \
+                mock.patch('src.services.arxiv_collector.extract_pdfs_parallel', side_effect=fake_extract) as extract:
+            for _ in range(2):
+                text = self.collector.download_and_extract_pdf('http://files.test/a.pdf', max_pages=2)
+                self.assertEqual(text, 'extracted text')
+        # 두 번째 호출은 저장된 PDF와 추출 텍스트를 사용
+        self.assertEqual(len(server.requests), 1)
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(extract.call_args.kwargs['max_pages'], 2)
+
+    def test_download_html_skips_stored_page(self):
+        html_url = 'https://chemrxiv.org/engage/chemrxiv/article-details/p1'
+        self.collector.artifacts.put_text('html', 'p1', '<article>stored</article>', source=html_url)
+        with mock.patch.object(self.collector, '_get_cached') as get_cached:
+            self.assertTrue(self.collector.download_html('p1'))
+        get_cached.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
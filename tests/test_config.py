@@ -0,0 +1,21 @@
+import unittest
+from src.config import DEFAULT_SCORING_WEIGHTS, parse_scoring_weights
+
+class TestScoringWeights(unittest.TestCase):
+    def test_overrides_defaults(self):
+        weights = parse_scoring_weights(' relevance = 0.8 ,content=0.1')
+        self.assertEqual(weights['relevance'], 0.8)
+        self.assertEqual(weights['content'], 0.1)
+        self.assertEqual(weights['author'], DEFAULT_SCORING_WEIGHTS['author'])
+
+    def test_skips_malformed_entries(self):
+        with self.assertLogs('rank_papers', level='WARNING') as logs:
+            weights = parse_scoring_weights('author,author=,=1,time=abc,keyword=-1,abstract=nan,,content=0.2')
+        self.assertEqual(len(logs.output), 6)
+        self.assertEqual(weights, dict(DEFAULT_SCORING_WEIGHTS, content=0.2))
+
+    def test_empty(self):
+        self.assertEqual(parse_scoring_weights(''), DEFAULT_SCORING_WEIGHTS)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import time
+import threading
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import requests
+from src.services.http_cache import HTTPResponseCache
+
+def make_response(body, headers=None):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+class TestHTTPResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = HTTPResponseCache(Path(self.tmp_dir.name))
+
+    def store(self, url, body, stored_at):
+        with mock.patch('src.services.http_cache.time.time', return_value=stored_at):
+            self.cache.get(mock.Mock(return_value=make_response(body)), url, ttl=3600)
+
+    def test_ttl_hit(self):
+        self.store('http://api.test/items', b'first', time.time())
+        fetch = mock.Mock()
+        response = self.cache.get(fetch, 'http://api.test/items', ttl=3600)
+        self.assertEqual(response.content, b'first')
+        fetch.assert_not_called()
+
+    def test_prune_expired(self):
+        now = time.time()
+        self.store('http://api.test/old', b'old', now - 10 * 86400)
+        self.store('http://api.test/new', b'new', now)
+        self.assertEqual(self.cache.prune(max_age=86400), 1)
+        self.assertEqual(len(list(self.cache.cache_dir.glob('*/*.json'))), 1)
+        self.assertEqual(len(list(self.cache.cache_dir.glob('*/*.body'))), 1)
+
+    def test_prune_oldest_over_size(self):
+        now = time.time()
+        for i in range(4):
+            self.store(f'http://api.test/{i}', b'x' * 1000, now - (4 - i))
+        self.assertEqual(self.cache.prune(max_bytes=2500), 2)
+        fetch = mock.Mock(return_value=make_response(b'fresh'))
+        self.assertEqual(self.cache.get(fetch, 'http://api.test/3', ttl=3600).content, b'x' * 1000)
+        self.assertEqual(self.cache.get(fetch, 'http://api.test/0', ttl=3600).content, b'fresh')
+
+    def test_prune_orphan_body(self):
+        self.store('http://api.test/items', b'body', time.time())
+        meta_path = next(self.cache.cache_dir.glob('*/*.json'))
+        body_path = meta_path.with_suffix('.body')
+        meta_path.unlink()
+        self.cache.prune()
+        self.assertTrue(body_path.exists())
+        old = time.time() - 7200
+        os.utime(body_path, (old, old))
+        self.cache.prune()
+        self.assertFalse(body_path.exists())
+
+    def test_concurrent_writes_same_entry(self):
+        path = self.cache.cache_dir / 'ab' / 'entry.body'
+        bodies = [bytes([i]) * 256 * 1024 for i in range(8)]
+        errors = []
+
+        def write(body):
+            try:
+                for _ in range(5):
+                    self.cache._write_atomic(path, body)
+            except OSError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(body,)) for body in bodies]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertIn(path.read_bytes(), bodies)
+        self.assertEqual(list(path.parent.glob('*.tmp')), [])
+
+if __name__ == '__main__':
+    unittest.main()
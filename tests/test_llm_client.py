@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+import requests
+from src.services.llm_client import DeepSeekClient
+
+def make_response(status_code, body=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b'{}' if body is None else body
+    return response
+
+class TestDeepSeekClient(unittest.TestCase):
+    def setUp(self):
+        self.client = DeepSeekClient('key', 'http://llm.test/v1/chat', max_in_flight=2,
+                                     max_retries=2)
+        self.client.session = mock.Mock()
+        patcher = mock.patch('src.services.llm_client.time.sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_releases_slot_on_body_error(self):
+        self.client.session.post.side_effect = requests.exceptions.ChunkedEncodingError('dropped')
+        for _ in range(3):
+            with self.assertRaises(requests.exceptions.ChunkedEncodingError):
+                self.client.chat({})
+            self.assertEqual(self.client.limiter.in_flight, 0)
+        self.assertEqual(self.client.session.post.call_count, 9)
+
+    def test_retries_after_request_exception(self):
+        self.client.session.post.side_effect = [
+            requests.exceptions.ContentDecodingError('bad gzip'),
+            make_response(200, b'{"ok": true}')
+        ]
+        self.assertEqual(self.client.chat({}), {'ok': True})
+        self.assertEqual(self.client.limiter.in_flight, 0)
+
+    def test_releases_slot_on_unexpected_error(self):
+        self.client.session.post.side_effect = ValueError('boom')
+        with self.assertRaises(ValueError):
+            self.client.chat({})
+        self.assertEqual(self.client.limiter.in_flight, 0)
+
+    def test_overload_shrinks_limit(self):
+        self.client.session.post.return_value = make_response(503)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.chat({})
+        self.assertEqual(self.client.limiter.limit, 1)
+        self.assertEqual(self.client.limiter.in_flight, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import time
+import tempfile
+import unittest
+from pathlib import Path
+from src.services.near_duplicates import NearDuplicateDetector
+
+ABSTRACT = (
+    'We report a copper catalyst for the electrochemical reduction of carbon dioxide to ethylene '
+    'with a Faradaic efficiency above seventy percent at industrial current densities. Operando '
+    'spectroscopy reveals that subsurface oxygen stabilizes the active sites during long term '
+    'operation in a flow cell electrolyzer.'
+)
+
+def make_paper(paper_id, published_date, version, abstract=ABSTRACT):
+    return {
+        'id': paper_id,
+        'title': 'Copper catalysts for CO2 electroreduction to ethylene',
+        'abstract': abstract,
+        'published_date': published_date,
+        'version': version
+    }
+
+class TestNearDuplicateDetector(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.db_path = Path(self.tmp_dir.name) / 'near_duplicates.db'
+        self.detector = self.open_detector()
+
+    def open_detector(self):
+        detector = NearDuplicateDetector(self.db_path)
+        self.addCleanup(detector.close)
+        return detector
+
+    def test_keeps_latest_version(self):
+        old = make_paper('v1', '2026-10-01T00:00:00Z', 1)
+        new = make_paper('v2', '2026-10-08T00:00:00Z', 2, ABSTRACT.replace('seventy', 'seventy two'))
+        other = make_paper('x', '2026-10-05T00:00:00Z', 1, 'An unrelated study of lithium metal anodes.')
+        result = self.detector.collapse([old, new, other])
+        self.assertEqual([paper['id'] for paper in result], ['v2', 'x'])
+        self.assertEqual(new['duplicate_ids'], ['v1'])
+
+    def test_matches_across_runs(self):
+        self.detector.collapse([make_paper('v1', '2026-10-01T00:00:00Z', 1)])
+        detector = self.open_detector()
+        newer = make_paper('v2', '2026-10-08T00:00:00Z', 2)
+        result = detector.collapse([newer])
+        self.assertEqual([paper['id'] for paper in result], ['v2'])
+        self.assertEqual(newer['duplicate_ids'], ['v1'])
+
+    def test_drops_paper_superseded_in_earlier_run(self):
+        self.detector.collapse([make_paper('v2', '2026-10-08T00:00:00Z', 2)])
+        self.assertEqual(self.detector.collapse([make_paper('v1', '2026-10-01T00:00:00Z', 1)]), [])
+
+    def test_does_not_match_itself_across_runs(self):
+        paper = make_paper('v1', '2026-10-01T00:00:00Z', 1)
+        self.detector.collapse([paper])
+        detector = self.open_detector()
+        again = make_paper('v1', '2026-10-01T00:00:00Z', 1)
+        result = detector.collapse([again])
+        self.assertEqual([paper['id'] for paper in result], ['v1'])
+        self.assertNotIn('duplicate_ids', again)
+
+    def test_prune_removes_old_signatures(self):
+        self.detector.collapse([make_paper('old', '2020-01-01T00:00:00Z', 1)])
+        recent = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(time.time() - 86400))
+        other = make_paper('new', recent, 1, 'An unrelated study of lithium metal anodes.')
+        self.detector.collapse([other])
+        self.assertEqual(self.detector.prune(max_age=90 * 86400), 1)
+        with self.detector._lock:
+            ids = {row[0] for row in self.detector._conn.execute("SELECT DISTINCT paper_id FROM buckets")}
+        self.assertEqual(ids, {'new'})
+        # 삭제된 논문과는 더 이상 비교하지 않음
+        again = make_paper('old-v2', '2026-10-08T00:00:00Z', 2)
+        self.detector.collapse([again])
+        self.assertNotIn('duplicate_ids', again)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+from src.services.rate_limiter import HostRateLimiter
+
+class TestHostRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.limiter = HostRateLimiter()
+
+    def test_same_configuration_keeps_bucket(self):
+        self.limiter.configure('https://api.test/v1', 1.0, 2)
+        bucket = self.limiter._bucket('api.test')
+        bucket.reserve(2)
+        # 다른 인스턴스가 같은 값으로 다시 설정해도 버킷이 가득 찬 상태로 초기화되지 않음
+        self.limiter.configure('https://api.test/v1', 1.0, 2)
+        self.assertIs(self.limiter._bucket('api.test'), bucket)
+        self.assertGreater(self.limiter._bucket('api.test').reserve(), 0.5)
+
+    def test_changed_configuration_replaces_bucket(self):
+        self.limiter.configure('api.test', 1.0, 2)
+        bucket = self.limiter._bucket('api.test')
+        self.limiter.configure('api.test', 5.0, 2)
+        self.assertIsNot(self.limiter._bucket('api.test'), bucket)
+        self.assertEqual(self.limiter._bucket('api.test').rate, 5.0)
+
+if __name__ == '__main__':
+    unittest.main()
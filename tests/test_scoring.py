@@ -0,0 +1,94 @@
+import datetime
+import unittest
+import numpy as np
+from src.services.relevance_index import BM25Index
+from src.services.scoring import COMPONENTS, build_feature_table, top_k
+
+# 환경 변수(SCORING_WEIGHTS)나 .env에 영향받지 않도록 가중치와 검색어를 고정
+WEIGHTS = {'author': 0.3, 'category': 0.3, 'keyword': 0.3, 'abstract': 0.2, 'time': 0.2, 'relevance': 0.5}
+SEARCH_TERMS = ['"CO2 reduction"', '"CO2 electroreduction"', '"lithium metal anode"']
+
+FILLER = 'we report the preparation characterization and evaluation of materials under various conditions '
+# 제출 후 정확히 10일 (최신성 점수 1.9)
+SUBMISSION_DATE = (datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=10, hours=1)).isoformat()
+
+def make_paper(paper_id, title, abstract, authors, keywords):
+    return {
+        'id': paper_id, 'title': title, 'abstract': abstract + ' ' + FILLER * 8,
+        'authors': [f'author {i}' for i in range(authors)], 'categories': ['Catalysis'],
+        'keywords': keywords, 'submission_date': SUBMISSION_DATE
+    }
+
+class TestRelevanceRanking(unittest.TestCase):
+    def setUp(self):
+        self.index = BM25Index()
+        self.query_terms = [tuple(BM25Index.tokenize(term)) for term in SEARCH_TERMS]
+        # 검색 결과로 구성되는 색인처럼 대부분 CO2 환원 논문
+        self.corpus = [
+            make_paper(f'c{i}', f'{topic} for CO2 reduction', f'CO2 reduction on {topic} electrodes', 4, ['CO2'])
+            for i, topic in enumerate(['Cu catalysts', 'Ag foams', 'Au nanoparticles', 'tin oxide', 'bismuth'] * 4)
+        ]
+        self.on_topic = make_paper(
+            'on', 'Electroreduction of CO2 to ethylene on Cu catalysts',
+            'The CO2 reduction reaction on copper yields ethylene with high selectivity and stability.',
+            3, ['CO2 reduction', 'copper']
+        )
+        self.off_topic = make_paper(
+            'off', 'Total synthesis of indole alkaloids via cascade cyclization',
+            'A concise total synthesis of monoterpene indole alkaloids using a palladium catalyzed cascade.',
+            8, ['alkaloid', 'total synthesis']
+        )
+    def score(self, papers, weights=WEIGHTS):
+        components = [COMPONENTS[name] for name, weight in weights.items() if weight]
+        table = build_feature_table(
+            papers, [feature for component in components for feature in component.features],
+            {'relevance_index': self.index, 'query_terms': self.query_terms}
+        )
+        return table, sum(weights[component.name] * component.compute(table) for component in components)
+
+    def test_focused_paper_gets_high_relevance(self):
+        table, _ = self.score(self.corpus + [self.on_topic, self.off_topic])
+        self.assertAlmostEqual(table['relevance'].iloc[-2], 0.71402, places=5)
+        self.assertEqual(table['relevance'].iloc[-1], 0.0)
+
+    def test_fixed_scores(self):
+        # 저자 0.3*min(0.2n, 2) + 카테고리 0.3*0.4 + 키워드 0.3*0.4 + 초록 0.2*0.01w + 최신성 0.2*1.9 + 관련성 0.5*2r
+        _, scores = self.score(self.corpus + [self.on_topic, self.off_topic])
+        np.testing.assert_allclose(scores[-2:], [1.73202, 1.318], atol=1e-5)
+        _, scores = self.score([self.on_topic, self.off_topic], dict(WEIGHTS, relevance=0.0))
+        np.testing.assert_allclose(scores, [1.018, 1.318])
+
+    def test_on_topic_outranks_off_topic(self):
+        for authors in (8, 12):
+            self.off_topic['authors'] = [f'author {i}' for i in range(authors)]
+            _, scores = self.score(self.corpus + [self.on_topic, self.off_topic])
+            self.assertGreater(scores[-2], scores[-1])
+
+    def test_relevance_within_range(self):
+        table, _ = self.score(self.corpus)
+        self.assertTrue(np.all((table['relevance'] >= 0) & (table['relevance'] <= 1)))
+
+class TestTopK(unittest.TestCase):
+    def setUp(self):
+        # 같은 점수가 많은 입력 (점수 0~4)
+        self.papers = [{'id': f'p{i}', 'score': (i * 7) % 5} for i in range(23)]
+
+    def score_batch(self, chunk):
+        return [paper['score'] for paper in chunk]
+
+    def expected(self, k):
+        ranked = sorted(self.papers, key=lambda paper: paper['score'], reverse=True)[:k]
+        return [(float(paper['score']), paper) for paper in ranked]
+
+    def test_matches_stable_full_sort(self):
+        for k in (0, 1, 4, 5, 12, 23, 30):
+            for chunk_size in (1, 3, 1000):
+                with self.subTest(k=k, chunk_size=chunk_size):
+                    self.assertEqual(top_k(self.papers, k, self.score_batch, chunk_size), self.expected(k))
+
+    def test_generator_input(self):
+        papers = (paper for paper in self.papers)
+        self.assertEqual(top_k(papers, 7, self.score_batch, chunk_size=4), self.expected(7))
+
+if __name__ == '__main__':
+    unittest.main()